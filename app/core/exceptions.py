@@ -1,7 +1,7 @@
 """Custom exception hierarchy for SEAMS."""
 from __future__ import annotations
 
-__all__ = ["SeamsError", "ImageLoadError", "ProcessingError", "GPUError", "CacheError"]
+__all__ = ["SeamsError", "ImageLoadError", "ProcessingError", "PreviewCanceled", "GPUError", "CacheError"]
 
 
 class SeamsError(Exception):
@@ -16,6 +16,10 @@ class ProcessingError(SeamsError):
     """Raised when texture processing fails."""
 
 
+class PreviewCanceled(SeamsError):
+    """Raised when a newer request supersedes an in-flight preview or job."""
+
+
 class GPUError(SeamsError):
     """Raised when a GPU operation fails after fallback."""
 
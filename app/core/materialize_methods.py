@@ -10,6 +10,7 @@ import numpy as np
 import cv2
 from .gpu_utils import GPUAccelerator, is_cuda_available
 from .assertions import assert_float32
+from .exceptions import PreviewCanceled
 
 
 def create_falloff_mask(shape, falloff=0.2, circular=False):
@@ -133,13 +134,15 @@ def synthesis_splat(image: np.ndarray, new_size: tuple = (1024, 1024),
                     grid_size: int = 8, scale: float = 1.0,
                     rotation: float = 0, rand_rot: float = 0,
                     wobble: float = 0.2, falloff: float = 0.2,
-                    cached_batches=None):
+                    cached_batches=None, is_canceled=None):
     """Create seamless texture using splatting (Texture Bombing).
 
     Accepts float32 input and returns float32 output.
 
     Args:
         cached_batches: Tuple (patches_arr, masks_arr) or None
+        is_canceled: Optional callable checked before each patch variation;
+            PreviewCanceled is raised once it returns True.
     Returns:
         (result_image, (patches_arr, masks_arr))
     """
@@ -215,6 +218,8 @@ def synthesis_splat(image: np.ndarray, new_size: tuple = (1024, 1024),
 
         # Generate variations
         for i in range(num_variations):
+            if is_canceled is not None and is_canceled():
+                raise PreviewCanceled("Splat synthesis superseded by a newer request")
             if num_variations == 1:
                 angle = rotation
             else:
@@ -13,7 +13,7 @@ from .inpainting import smart_seam_inpaint
 from .delighting import delight_image
 from .gpu_utils import GPUAccelerator, is_cuda_available
 from .cache import ResultCache, hash_image, make_pipeline_key
-from .exceptions import ProcessingError, ImageLoadError
+from .exceptions import ProcessingError, ImageLoadError, PreviewCanceled
 
 class SeamlessProcessor:
     """
@@ -27,6 +27,7 @@ class SeamlessProcessor:
         self._processed_image = None
         self._delighted_image = None
         self._image_hash = None
+        self.has_image = False  # Cheap check for the GUI's per-tick preview path
         
         # Performance optimizations
         self._cache = ResultCache(max_size=50)
@@ -107,6 +108,7 @@ class SeamlessProcessor:
         if isinstance(image, str):
             self._original_image = cv2.imread(image, cv2.IMREAD_UNCHANGED)
             if self._original_image is None:
+                self.has_image = False
                 raise ImageLoadError(f"Failed to read image: {image}")
         else:
             # Input validation
@@ -135,19 +137,30 @@ class SeamlessProcessor:
         if self._original_image is not None:
              # Hash image for cache key
              self._image_hash = hash_image(self._original_image)
-             
-             h, w = self._original_image.shape[:2]
-             max_dim = 600  # Higher resolution for sharper live previews
-             if max(h, w) > max_dim:
-                 scale = max_dim / max(h, w)
-                 new_w = int(w * scale)
-                 new_h = int(h * scale)
-                 self._preview_image = cv2.resize(self._original_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-             else:
-                 self._preview_image = self._original_image.copy()
+             self.build_preview_cache()
+             self.has_image = True
+
+    def build_preview_cache(self, max_dim=600):
+        """
+        Downscale the loaded image once for preview processing.
+
+        process(preview=True) reuses this image until the next load_image().
+
+        Args:
+            max_dim: Longest side of the preview image (600 keeps live previews sharp).
+        """
+        h, w = self._original_image.shape[:2]
+        if max(h, w) > max_dim:
+            scale = max_dim / max(h, w)
+            new_w = int(w * scale)
+            new_h = int(h * scale)
+            self._preview_image = cv2.resize(self._original_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        else:
+            # Read-only use in process(), which copies before working on it.
+            self._preview_image = self._original_image
     
     def process(self, image=None, preview=False, params=None, use_cache: bool = True,
-                chunked: bool = True):
+                chunked: bool = True, is_canceled=None):
         """
         Process the image to create a seamless texture with caching.
         
@@ -157,6 +170,9 @@ class SeamlessProcessor:
             params (dict): Optional parameter overrides.
             use_cache (bool): If True, check/store result in cache (default True).
             chunked (bool): If True, auto-select chunked path for large images.
+            is_canceled (callable): Optional check run between pipeline stages
+                and inside the tile and patch loops; when it returns True,
+                PreviewCanceled is raised.
         
         Returns:
             Processed seamless texture
@@ -173,7 +189,8 @@ class SeamlessProcessor:
         # Auto-select chunked path for large images
         h, w = self._original_image.shape[:2]
         if chunked and not preview and max(h, w) > 2048:
-            return self.run_pipeline_chunked(self._original_image, chunk_size=1024, overlap=64)
+            return self.run_pipeline_chunked(self._original_image, chunk_size=1024, overlap=64,
+                                             is_canceled=is_canceled)
         
         # Check cache (both preview and full-res when use_cache is True)
         if use_cache and self._image_hash:
@@ -196,14 +213,16 @@ class SeamlessProcessor:
         
         # Apply delighting/flattening
         if self.delight_strength > 0 or self.flatness > 0:
+            self._check_canceled(is_canceled)
             img = delight_image(img, strength=self.delight_strength, flatness=self.flatness)
         
         # Store for UI display
         self._delighted_image = img.copy()
+        self._check_canceled(is_canceled)
         
         # Choose method
         if self.method == 'splat':
-            result = self._process_splat(img)
+            result = self._process_splat(img, is_canceled)
         else:  # overlap (default)
             result = self._process_overlap(img)
         
@@ -217,6 +236,12 @@ class SeamlessProcessor:
         
         return result
     
+    @staticmethod
+    def _check_canceled(is_canceled):
+        """Abort between stages once the caller's request has been superseded."""
+        if is_canceled is not None and is_canceled():
+            raise PreviewCanceled("Preview superseded by a newer request")
+
     def _get_cache_params(self):
         """Get current parameters for cache key."""
         return {
@@ -244,7 +269,7 @@ class SeamlessProcessor:
         self._processed_image = result
         return result
         
-    def _process_splat(self, img):
+    def _process_splat(self, img, is_canceled=None):
         """Process using Splat method with patch caching."""
         h, w = img.shape[:2]
 
@@ -270,7 +295,8 @@ class SeamlessProcessor:
             rand_rot=self.splat_random_rotation,
             wobble=self.splat_wobble,
             falloff=self.edge_falloff,
-            cached_batches=cached_batches
+            cached_batches=cached_batches,
+            is_canceled=is_canceled,
         )
 
         # Store in cache if newly generated
@@ -523,7 +549,7 @@ class SeamlessProcessor:
         return self.use_gpu
 
     def run_pipeline_chunked(self, img: 'np.ndarray', chunk_size: int = 1024,
-                              overlap: int = 64, **kwargs) -> 'np.ndarray':
+                              overlap: int = 64, is_canceled=None, **kwargs) -> 'np.ndarray':
         """Process large images in overlapping tiles to avoid OOM.
 
         Splits the image into (chunk_size x chunk_size) tiles with *overlap*
@@ -532,6 +558,7 @@ class SeamlessProcessor:
         over the overlap zone.
 
         Falls back to :meth:`process` directly for images <= 2048px.
+        ``is_canceled`` is checked before every tile (see :meth:`process`).
         """
         import logging
         import time
@@ -540,7 +567,7 @@ class SeamlessProcessor:
         h, w = img.shape[:2]
 
         if max(h, w) <= 2048:
-            return self.process(image=img, preview=False, chunked=False, **kwargs)
+            return self.process(image=img, preview=False, chunked=False, is_canceled=is_canceled, **kwargs)
 
         t0 = time.perf_counter()
         result = img.copy()
@@ -558,6 +585,7 @@ class SeamlessProcessor:
         for y0 in tiles_y:
             for x0 in tiles_x:
                 tile_idx += 1
+                self._check_canceled(is_canceled)
                 y1 = min(y0 + chunk_size + overlap, h)
                 x1 = min(x0 + chunk_size + overlap, w)
                 # Also expand backwards for overlap
@@ -570,7 +598,7 @@ class SeamlessProcessor:
                 tile_processor = SeamlessProcessor()
                 tile_processor.set_parameters(**self._get_cache_params())
                 tile_processor.load_image(tile)
-                processed = tile_processor.process(preview=False, chunked=False)
+                processed = tile_processor.process(preview=False, chunked=False, is_canceled=is_canceled)
                 tile_ms = (time.perf_counter() - t_tile) * 1000.0
                 logger.debug("  tile %d/%d: %dms", tile_idx, total_tiles, int(tile_ms))
 
@@ -0,0 +1,23 @@
+"""
+JIT-compiled tiling composer for the 2D viewport's tile mode.
+
+Works on 32-bit packed pixels (one uint32 per ARGB32 pixel) so a scaled
+tile can be repeated over the whole visible grid in a single parallel pass.
+"""
+from __future__ import annotations
+
+from numba import jit, prange
+
+__all__ = ["compose_tiles_jit"]
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def compose_tiles_jit(dst, tile):
+    """Fill ``dst`` (H, W) with ``tile`` (th, tw) repeated from the origin (in-place)."""
+    h, w = dst.shape
+    th, tw = tile.shape
+
+    for y in prange(h):
+        src_row = tile[y % th]
+        for x in range(w):
+            dst[y, x] = src_row[x % tw]
@@ -86,6 +86,18 @@ def warmup_all_jit_functions() -> Dict[str, float]:
     except Exception as exc:
         logger.warning("warmup splat_jit failed: %s", exc)
 
+    # --- tile_compose_jit (2D viewport tile mode) ---
+    try:
+        from .tile_compose_jit import compose_tiles_jit
+
+        t0 = time.perf_counter()
+        compose_tiles_jit(np.zeros((64, 64), dtype=np.uint32), np.zeros((16, 16), dtype=np.uint32))
+        elapsed = (time.perf_counter() - t0) * 1000.0
+        timings["tile_compose_jit"] = elapsed
+        logger.info("warmup tile_compose_jit: %.1f ms", elapsed)
+    except Exception as exc:
+        logger.warning("warmup tile_compose_jit failed: %s", exc)
+
     total_ms = sum(timings.values())
     logger.info("warmup total: %.1f ms (%d functions)", total_ms, len(timings))
     return timings
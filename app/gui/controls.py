@@ -233,6 +233,8 @@ class PreprocessingPanel(PanelShell):
             "Remove baked lighting, gradients, ambient occlusion and color cast before seamless processing.",
             parent,
         )
+        # get_parameters() result, rebuilt only after a slider changes.
+        self._params_cache = None
 
         insight = PluginCard("Light Field Analysis", "Balance shadows while preserving usable surface grain.")
         insight.body.addWidget(MiniGraph("#31e6bd"))
@@ -253,6 +255,8 @@ class PreprocessingPanel(PanelShell):
             ("Edge Consistency", "edge", 0, 100, 0),
         ]:
             slider = LabeledSlider(label, lo, hi, default)
+            slider.valueChanged.connect(self._invalidate_params)
+            slider.sliderMoved.connect(self._invalidate_params)
             slider.valueChanged.connect(self.parametersChanged.emit)
             slider.sliderMoved.connect(self.livePreviewRequested.emit)
             self._sliders[key] = slider
@@ -289,7 +293,15 @@ class PreprocessingPanel(PanelShell):
             slider.setValue(0)
         self.parametersChanged.emit()
 
+    def _invalidate_params(self, *_args):
+        self._params_cache = None
+
     def get_parameters(self):
+        if self._params_cache is None:
+            self._params_cache = self._read_parameters()
+        return dict(self._params_cache)
+
+    def _read_parameters(self):
         shadow = self._sliders["shadow"].value() / 100.0
         flatness = self._sliders["flatness"].value() / 100.0
         delight = max(shadow, self._sliders["ao"].value() / 100.0, self._sliders["highlight"].value() / 100.0)
@@ -318,6 +330,8 @@ class ControlPanel(PanelShell):
             "Edge-aware synthesis controls for production-ready tiling textures.",
             parent,
         )
+        # get_parameters() result, rebuilt only after a control changes.
+        self._params_cache = None
 
         analysis = PluginCard("Seam Intelligence", "Edge balance, overlap energy and repeat risk.")
         analysis.body.addWidget(MiniGraph("#8f70ff"))
@@ -388,18 +402,26 @@ class ControlPanel(PanelShell):
         self.export_btn.setEnabled(False)
 
     def _on_method_changed(self, _index):
+        self._params_cache = None
         is_splat = self.method_combo.currentData() == "splat"
         self.overlap_card.setVisible(not is_splat)
         self.splat_card.setVisible(is_splat)
         self.parametersChanged.emit()
 
     def _on_param_changed(self, *_args):
+        self._params_cache = None
         self.parametersChanged.emit()
 
     def _on_live_update(self, *_args):
+        self._params_cache = None
         self.livePreviewRequested.emit()
 
     def get_parameters(self):
+        if self._params_cache is None:
+            self._params_cache = self._read_parameters()
+        return dict(self._params_cache)
+
+    def _read_parameters(self):
         method = self.method_combo.currentData()
         edge_falloff = (self.sp_falloff_slider.value() if method == "splat" else self.ov_falloff_slider.value()) / 100.0
         return {
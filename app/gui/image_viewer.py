@@ -1,10 +1,14 @@
 """Image viewing and realtime material studio workspaces."""
 from __future__ import annotations
 
-import cv2
+import sys
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+
 import numpy as np
-from PyQt6.QtCore import QPoint, QRect, QRectF, QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PyQt6.QtCore import QObject, QPoint, QRect, QRectF, QRunnable, QSize, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPainterPath, QPen, QPixmap
 from PyQt6.QtWidgets import (
     QButtonGroup,
     QCheckBox,
@@ -25,8 +29,33 @@ from PyQt6.QtWidgets import (
 from ..utils.app_logging import get_logger, log_exception
 from .pbr_viewport import CHANNELS, PBRViewport
 
+try:
+    from ..core.tile_compose_jit import compose_tiles_jit
+    HAS_NUMBA_TILING = True
+except ImportError:
+    HAS_NUMBA_TILING = False
+
 
 logger = get_logger(__name__)
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# (ndim, channels) -> QImage format reading OpenCV channel order directly.
+# Qt has no BGRA8888; ARGB32 is B, G, R, A in memory on little-endian.
+_QIMAGE_FORMATS = {
+    (2, 1): QImage.Format.Format_Grayscale8,
+    (3, 3): QImage.Format.Format_BGR888,
+    (3, 4): QImage.Format.Format_ARGB32,
+}
+# Pixmaps for numpy arrays that are still alive, keyed by id() and validated
+# with a weak reference. The same frame is typically handed to several views.
+_PIXMAP_CACHE: OrderedDict[int, tuple] = OrderedDict()
+_PIXMAP_CACHE_SIZE = 8
+# Smooth-scaled pixmaps keyed on (source cacheKey, width, height).
+_SCALED_CACHE: OrderedDict[tuple, QPixmap] = OrderedDict()
+_SCALED_CACHE_SIZE = 8
+# Frames at least this large are converted on a worker thread.
+_ASYNC_CONVERT_MIN_PIXELS = 2048 * 2048
+# Pyramid levels stop once the short side would drop below this.
+_LOD_MIN_SIDE = 64
 CHANNEL_ORDER = [
     "Base Color",
     "Normal",
@@ -50,19 +79,184 @@ CHANNEL_LABELS = {
 }
 
 
+@dataclass
+class _PaintGeom:
+    """Content geometry of a TextureViewport, independent of the pan offset.
+
+    ``x``/``y`` is the centred origin; paint adds the pan. ``chrome`` holds the
+    split handle and BEFORE/AFTER areas relative to that origin (split mode only).
+    """
+
+    x: int
+    y: int
+    tile_w: int
+    tile_h: int
+    sw: int
+    sh: int
+    scale: float
+    split_offset: int
+    chrome: tuple | None = None
+
+
+def _qimage_buffer(img):
+    """Return a C-contiguous array whose bytes match the format numpy_to_qimage picks."""
+    if img.ndim == 3 and img.shape[2] == 4 and not _LITTLE_ENDIAN:
+        # Format_ARGB32 is stored A, R, G, B on big-endian hosts.
+        img = img[..., ::-1]
+    return np.ascontiguousarray(img)
+
+
+def numpy_to_qimage(img):
+    """Wrap a contiguous OpenCV-ordered array in a QImage without copying.
+
+    The QImage borrows ``img``'s buffer, so the array must outlive it.
+    """
+    shape = img.shape
+    fmt = _QIMAGE_FORMATS[(img.ndim, shape[2] if img.ndim == 3 else 1)]
+    return QImage(img.data, shape[1], shape[0], img.strides[0], fmt)
+
+
+def _packed_pixels(qimg):
+    """View a 32-bit QImage's pixels as a (height, width) uint32 array."""
+    ptr = qimg.bits()
+    ptr.setsize(qimg.sizeInBytes())
+    rows = np.frombuffer(ptr, dtype=np.uint32).reshape(qimg.height(), qimg.bytesPerLine() // 4)
+    return rows[:, : qimg.width()]
+
+
+def compose_tiled_image(tile, width, height):
+    """Repeat ``tile`` over a width x height QImage with the Numba composer.
+
+    Returns None when Numba is unavailable so callers can fall back to Qt.
+    """
+    if not HAS_NUMBA_TILING:
+        return None
+    fmt = QImage.Format.Format_ARGB32_Premultiplied
+    src = tile.toImage().convertToFormat(fmt)
+    dst = QImage(width, height, fmt)
+    compose_tiles_jit(_packed_pixels(dst), _packed_pixels(src))
+    return dst
+
+
 def numpy_to_pixmap(img):
     if img is None:
         return None
-    if len(img.shape) == 2:
-        img = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-    elif img.shape[2] == 4:
-        img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-    else:
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    h, w, c = img.shape
-    fmt = QImage.Format.Format_RGBA8888 if c == 4 else QImage.Format.Format_RGB888
-    qimg = QImage(img.data, w, h, w * c, fmt)
-    return QPixmap.fromImage(qimg.copy())
+    pixmap = _cached_pixmap(img)
+    if pixmap is None:
+        pixmap = _convert_to_pixmap(img)
+        _remember_pixmap(id(img), img, _pixmap_signature(img), pixmap)
+    return pixmap
+
+
+def _pixmap_signature(img):
+    return (img.__array_interface__["data"][0], img.shape, img.strides, img.dtype.str)
+
+
+def _cached_pixmap(img):
+    """Return the cached pixmap for this very array, or None."""
+    key = id(img)
+    entry = _PIXMAP_CACHE.get(key)
+    if entry is not None and entry[0]() is img and entry[1] == _pixmap_signature(img):
+        _PIXMAP_CACHE.move_to_end(key)
+        return entry[2]
+    return None
+
+
+def _remember_pixmap(key, img, signature, pixmap):
+    """Cache ``pixmap`` for as long as the very same array object is alive.
+
+    Holding a weak reference (rather than keying on the data pointer alone)
+    keeps a recycled allocation from ever returning another image's pixmap.
+    """
+
+    def _forget(ref, key=key):
+        current = _PIXMAP_CACHE.get(key)
+        if current is not None and current[0] is ref:
+            del _PIXMAP_CACHE[key]
+
+    try:
+        ref = weakref.ref(img, _forget)
+    except TypeError:
+        return
+    _PIXMAP_CACHE[key] = (ref, signature, pixmap)
+    _PIXMAP_CACHE.move_to_end(key)
+    while len(_PIXMAP_CACHE) > _PIXMAP_CACHE_SIZE:
+        _PIXMAP_CACHE.popitem(last=False)
+
+
+def _scaled_pixmap(pixmap, width, height, source=None):
+    """Return ``pixmap`` smooth-scaled to ``width`` x ``height``, LRU-cached.
+
+    Entries are keyed on the pixmap's cacheKey, so a new image never hits a
+    stale entry. When a missing entry is built, ``source`` (a mip level of
+    ``pixmap``) is scaled instead of the full-resolution pixmap.
+    """
+    key = (pixmap.cacheKey(), width, height)
+    scaled = _SCALED_CACHE.get(key)
+    if scaled is not None:
+        _SCALED_CACHE.move_to_end(key)
+        return scaled
+    scaled = (pixmap if source is None else source).scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+    _SCALED_CACHE[key] = scaled
+    while len(_SCALED_CACHE) > _SCALED_CACHE_SIZE:
+        _SCALED_CACHE.popitem(last=False)
+    return scaled
+
+
+def numpy_to_native_qimage(img):
+    """Return an owned QImage in the raster engine's native format.
+
+    Safe to call off the GUI thread; ``QPixmap.fromImage`` on the result is
+    then a cheap wrap instead of a format conversion.
+    """
+    qimg = numpy_to_qimage(_qimage_buffer(img))
+    if qimg.hasAlphaChannel():
+        return qimg.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    return qimg.convertToFormat(QImage.Format.Format_RGB32)
+
+
+class _ConversionSignals(QObject):
+    converted = pyqtSignal(int, QImage)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.latest = 0
+
+
+class _ConversionTask(QRunnable):
+    """Convert one numpy frame to a native QImage on a worker thread."""
+
+    def __init__(self, img, generation, signals):
+        super().__init__()
+        self._img = img
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):
+        try:
+            if self._signals.latest != self._generation:
+                return
+            qimg = numpy_to_native_qimage(self._img)
+            self._signals.converted.emit(self._generation, qimg)
+        except RuntimeError:
+            # The viewer was destroyed while this frame was converting.
+            pass
+        except Exception as exc:
+            log_exception(logger, "Background image conversion failed", exc)
+
+
+def _convert_to_pixmap(img):
+    img = _qimage_buffer(img)
+    # None of the wrapped formats is a native raster format, so fromImage
+    # converts straight from the numpy buffer into RGB32 / premultiplied ARGB32
+    # in one pass. That conversion owns its memory (nothing borrows ``img``) and
+    # yields the layout the raster engine blits fastest.
+    return QPixmap.fromImage(numpy_to_qimage(img))
 
 
 class TextureViewport(QWidget):
@@ -74,6 +268,7 @@ class TextureViewport(QWidget):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self._before = None
+        self._before_size = None
         self._after = None
         self._mode = "split"
         self._zoom = 1.0
@@ -85,47 +280,217 @@ class TextureViewport(QWidget):
         self._dragging_pan = False
         self._dragging_split = False
         self._last_content_rect = QRect()
+        # _PaintGeom rebuilt lazily on zoom, resize, image, mode or split changes.
+        self._geom = None
+        self._layout_dirty = True
+        # (key, QImage) of both split halves, reused while only the pan changes.
+        self._split_composed = None
+        # Backing store for the split composite, reused until its size changes.
+        self._split_backing = None
+        # Tile mode renders the N x N grid (plus guides) once into this QImage
+        # so panning is a single blit.
+        self._composed = None
+        # Tile guides as one origin-relative path, keyed on the grid geometry.
+        self._guide_path_key = None
+        self._guide_path = QPainterPath()
+        # Per-source mip chains ("before"/"after"), level 0 is the pixmap itself.
+        self._lods = {}
+        # Last fully rendered idle frame, re-blitted while nothing has changed.
+        self._last_frame = None
+        self._frame_dirty = True
+        self._interactive = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(120)
+        self._idle_timer.timeout.connect(self._on_interaction_idle)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._schedule_update)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        # Paint resources are built once instead of on every frame.
+        self._bg_color = QColor("#07080c")
+        self._placeholder_color = QColor("#737891")
+        self._divider_pen = QPen(QColor(255, 255, 255, 28), 1)
+        self._backdrop_color = QColor(3, 5, 9, 150)
+        self._bounds_pen = QPen(QColor(255, 255, 255, 42), 1, Qt.PenStyle.DashLine)
+        self._grid_pen = QPen(QColor("#38d5c2"), 1, Qt.PenStyle.DashLine)
+        self._split_pen = QPen(QColor("#31e6bd"), 2)
+        self._handle_color = QColor("#101823")
+        self._handle_pen = QPen(QColor("#31e6bd"), 1)
+        self._label_color = QColor("#dffdf8")
+        self._label_bg_color = QColor(4, 6, 10, 170)
         self.setMouseTracking(True)
 
     def set_before_image(self, img):
-        self._before = numpy_to_pixmap(img)
-        self.update()
+        self.set_before_pixmap(numpy_to_pixmap(img))
+
+    def set_before_pixmap(self, pix):
+        self._before = pix
+        self._lods.pop("before", None)
+        self._before_size = (self._before.width(), self._before.height()) if self._before else None
+        self._invalidate_layout()
+        self._schedule_update()
 
     def set_after_image(self, img):
         self._after = numpy_to_pixmap(img)
-        self.update()
+        self._lods.pop("after", None)
+        self._invalidate_layout()
+        self._schedule_update()
 
     def set_after_pixmap(self, pix):
         self._after = pix
-        self.update()
+        self._lods.pop("after", None)
+        self._invalidate_layout()
+        self._schedule_update()
 
     def set_mode(self, mode):
         self._mode = "single" if mode == "seamless" else mode
-        self.update()
+        self._invalidate_layout()
+        self._schedule_update()
 
     def set_tiles(self, n):
         self._tiles = max(1, int(n))
-        self.update()
+        self._invalidate_layout()
+        self._schedule_update()
 
     def set_show_guides(self, show):
         self._show_guides = show
-        self.update()
+        self._composed = None
+        self._request_update()
 
     def set_zoom(self, zoom):
         self._zoom = max(0.1, float(zoom))
-        self.update()
+        self._invalidate_layout()
+        self._schedule_update()
 
     def fit_to_view(self):
+        if self._zoom == 1.0 and self._pan.isNull():
+            # Already fitted; size changes are tracked by resizeEvent.
+            return
         self._zoom = 1.0
         self._pan = QPoint(0, 0)
-        self.update()
+        self._invalidate_layout()
+        self._schedule_update()
+
+    def _schedule_update(self):
+        self._frame_dirty = True
+        # Hidden viewports (the inactive workspace) repaint on show anyway.
+        if self.isVisible():
+            self.update()
+
+    def _mark_interactive(self):
+        """Draw fast, coarse frames until input has been idle for 120 ms."""
+        self._interactive = True
+        self._idle_timer.start()
+
+    def _on_interaction_idle(self):
+        self._interactive = False
+        self._schedule_update()
+
+    def _request_update(self):
+        """Coalesce input-driven repaints to at most one per ~60 Hz frame."""
+        self._frame_dirty = True
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _invalidate_layout(self):
+        self._layout_dirty = True
+        self._composed = None
+        self._split_composed = None
+
+    def _ensure_layout(self):
+        """Return the cached content geometry, recomputing it only when dirty."""
+        if not self._layout_dirty:
+            return self._geom
+        self._layout_dirty = False
+        self._geom = None
+        if self._after and not self._after.isNull():
+            w, h = self._after.width(), self._after.height()
+        elif self._before_size:
+            w, h = self._before_size
+        else:
+            return None
+        view_w, view_h = self.width(), self.height()
+        tile_factor = self._tiles if self._mode == "tile" else 1
+        scale = min(view_w / max(1, w * tile_factor), view_h / max(1, h * tile_factor)) * self._zoom
+        scale = max(0.001, scale)
+        tile_w, tile_h = int(w * scale), int(h * scale)
+        sw, sh = tile_w * tile_factor, tile_h * tile_factor
+        if sw <= 0 or sh <= 0:
+            return None
+        split_offset = int(sw * self._split_ratio)
+        chrome = None
+        if self._mode == "split":
+            right, bottom = sw - 1, sh - 1
+            chrome = (
+                QRect(max(4, min(right - 40, split_offset - 18)), bottom - 42, 36, 28),
+                QRect(0, 0, split_offset, sh),
+                QRect(split_offset, 0, right - split_offset + 1, sh),
+            )
+        self._geom = _PaintGeom((view_w - sw) // 2, (view_h - sh) // 2, tile_w, tile_h, sw, sh, scale, split_offset, chrome)
+        return self._geom
+
+    def resizeEvent(self, event):
+        # Keep the stale tiled composition (stretched) until resizing settles.
+        self._layout_dirty = True
+        self._resize_timer.start()
+        super().resizeEvent(event)
+
+    def _on_resize_settled(self):
+        self._composed = None
+        self._split_composed = None
+        self._schedule_update()
 
     def paintEvent(self, event):
+        if event.rect().isEmpty():
+            return
+        frame = self._last_frame
+        dpr = self.devicePixelRatioF()
+        frame_size = QSize(round(self.width() * dpr), round(self.height() * dpr))
+        if frame is not None and frame.size() != frame_size:
+            frame = self._last_frame = None
+        if frame is not None and not self._frame_dirty:
+            # Expose events with no state change just re-blit the last frame.
+            painter = QPainter(self)
+            try:
+                painter.drawPixmap(0, 0, frame)
+            finally:
+                painter.end()
+            return
+        if self._interactive:
+            # Interactive frames are superseded immediately; skip the copy.
+            painter = QPainter(self)
+            try:
+                self._render(painter)
+            finally:
+                painter.end()
+            return
+        if frame is None:
+            frame = QPixmap(frame_size)
+            frame.setDevicePixelRatio(dpr)
+        painter = QPainter(frame)
+        try:
+            self._render(painter)
+        finally:
+            painter.end()
+        self._last_frame = frame
+        self._frame_dirty = False
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        painter.fillRect(self.rect(), QColor("#07080c"))
+        try:
+            painter.drawPixmap(0, 0, frame)
+        finally:
+            painter.end()
+
+    def _render(self, painter):
+        interactive = self._interactive
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not interactive)
+        painter.fillRect(self.rect(), self._bg_color)
         if not self._before and not self._after:
-            painter.setPen(QColor("#737891"))
+            painter.setPen(self._placeholder_color)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Double-click to import image")
             return
 
@@ -136,36 +501,68 @@ class TextureViewport(QWidget):
         content_rect = QRect()
 
         if self._mode == "side_by_side":
-            content_rect = self._paint_side_by_side(painter)
+            content_rect = self._paint_side_by_side(painter, interactive)
         else:
-            w, h = target.width(), target.height()
-            view_w, view_h = self.width(), self.height()
-            tile_factor = self._tiles if self._mode == "tile" else 1
-            scale = min(view_w / max(1, w * tile_factor), view_h / max(1, h * tile_factor)) * self._zoom
-            scale = max(0.001, scale)
-            tile_w, tile_h = int(w * scale), int(h * scale)
-            sw, sh = tile_w * tile_factor, tile_h * tile_factor
-            if sw <= 0 or sh <= 0:
+            geom = self._ensure_layout()
+            if geom is None:
                 return
-
-            ox = (view_w - sw) // 2 + self._pan.x()
-            oy = (view_h - sh) // 2 + self._pan.y()
+            ox, oy = geom.x + self._pan.x(), geom.y + self._pan.y()
+            tile_w, tile_h, sw, sh = geom.tile_w, geom.tile_h, geom.sw, geom.sh
+            split_x = ox + geom.split_offset
             content_rect = QRect(ox, oy, sw, sh)
 
             if self._mode == "tile":
-                for row in range(self._tiles):
-                    for col in range(self._tiles):
-                        painter.drawPixmap(ox + col * tile_w, oy + row * tile_h, tile_w, tile_h, target)
-                if self._show_guides:
-                    self._draw_tile_guides(painter, content_rect, tile_w, tile_h)
+                source = self._lod_pixmap("after", target, tile_w)
+                composed = self._ensure_composed(source, tile_w, tile_h, sw, sh)
+                if composed is not None:
+                    painter.drawImage(content_rect, composed)
+                elif tile_w * tile_h <= 4 * max(1, self.width() * self.height()):
+                    painter.drawTiledPixmap(content_rect, _scaled_pixmap(source, tile_w, tile_h))
+                    if self._show_guides:
+                        self._draw_tile_guides(painter, content_rect, tile_w, tile_h)
+                else:
+                    # A single tile is larger than the view; let Qt clip each draw.
+                    for row in range(self._tiles):
+                        for col in range(self._tiles):
+                            painter.drawPixmap(ox + col * tile_w, oy + row * tile_h, tile_w, tile_h, source)
+                    if self._show_guides:
+                        self._draw_tile_guides(painter, content_rect, tile_w, tile_h)
             elif self._mode == "split":
-                self._paint_split(painter, target, content_rect, scale)
+                # Panning blits the cached composite, so only split drags go coarse.
+                self._paint_split(painter, target, content_rect, split_x, sw // (2 if self._dragging_split and interactive else 1))
             else:
-                painter.drawPixmap(content_rect, target)
+                painter.drawPixmap(content_rect, self._display_pixmap("after", target, sw, sh, interactive))
 
         self._last_content_rect = content_rect
 
-    def _paint_side_by_side(self, painter):
+    def _ensure_composed(self, target, tile_w, tile_h, sw, sh):
+        """Build the tiled grid once per (image, tiles, zoom, size) state."""
+        if self._composed is not None:
+            if self._composed.width() == sw and self._composed.height() == sh:
+                return self._composed
+            if self._resize_timer.isActive():
+                return self._composed
+        # Deep zoom would allocate far more than the visible area; draw directly instead.
+        if sw * sh > 4 * max(1, self.width() * self.height()):
+            return None
+        tile = _scaled_pixmap(target, tile_w, tile_h)
+        # Kept as a QImage and drawn with drawImage: on the raster engine that
+        # is the same blit as a pixmap, minus the fromImage wrap per rebuild.
+        composed = compose_tiled_image(tile, sw, sh)
+        if composed is not None:
+            painter = QPainter(composed)
+        else:
+            composed = QImage(sw, sh, QImage.Format.Format_ARGB32_Premultiplied)
+            composed.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(composed)
+            painter.drawTiledPixmap(composed.rect(), tile)
+        if self._show_guides:
+            self._draw_tile_guides(painter, composed.rect(), tile_w, tile_h)
+        painter.end()
+        self._composed = composed
+        return composed
+
+    def _paint_side_by_side(self, painter, interactive=False):
         before = self._before
         after = self._after if self._after else self._before
         if not before and not after:
@@ -176,32 +573,106 @@ class TextureViewport(QWidget):
         panel_h = max(1, self.height() - margin * 2)
         left_area = QRect(margin, margin, panel_w, panel_h)
         right_area = QRect(margin + panel_w + gap, margin, panel_w, panel_h)
-        self._draw_panel_backdrop(painter, left_area)
-        self._draw_panel_backdrop(painter, right_area)
-        left_rect = self._draw_fitted_pixmap(painter, before, left_area)
-        right_rect = self._draw_fitted_pixmap(painter, after, right_area)
-        painter.setPen(QPen(QColor(255, 255, 255, 28), 1))
+        self._draw_panel_backdrops(painter, left_area, right_area)
+        left_rect = self._draw_fitted_pixmap(painter, before, left_area, "before", interactive)
+        right_rect = self._draw_fitted_pixmap(painter, after, right_area, "after", interactive)
+        painter.setPen(self._divider_pen)
         painter.drawLine(left_area.right() + gap // 2, margin, left_area.right() + gap // 2, self.height() - margin)
-        self._draw_corner_label(painter, left_area, "BEFORE")
-        self._draw_corner_label(painter, right_area, "AFTER")
+        self._draw_labels(painter, [], [(left_area, "BEFORE"), (right_area, "AFTER")])
         return left_rect.united(right_rect)
 
-    def _paint_split(self, painter, target, rect, scale):
-        before = self._before if self._before else target
-        after = self._after if self._after else target
-        painter.drawPixmap(rect, before)
-        split_x = rect.left() + int(rect.width() * self._split_ratio)
-        if after:
-            target_rect = QRectF(float(split_x), float(rect.top()), float(rect.right() - split_x + 1), float(rect.height()))
-            src_x = max(0.0, (split_x - rect.left()) / scale)
-            src_w = max(1.0, target_rect.width() / scale)
-            src_rect = QRectF(src_x, 0.0, src_w, after.height())
-            painter.drawPixmap(target_rect, after, src_rect)
+    def _lod_pixmap(self, key, pixmap, display_w):
+        """Return the coarsest pyramid level of ``pixmap`` still ``display_w`` wide.
+
+        Levels are halved with smooth scaling on demand and kept until another
+        pixmap is shown under ``key``.
+        """
+        if pixmap is None or pixmap.isNull():
+            return pixmap
+        levels = self._lods.get(key)
+        if levels is None or levels[0] is not pixmap:
+            levels = self._lods[key] = [pixmap]
+        index = 0
+        while True:
+            level = levels[index]
+            half_w, half_h = level.width() // 2, level.height() // 2
+            if half_w < display_w or min(half_w, half_h) < _LOD_MIN_SIDE:
+                return level
+            index += 1
+            if index == len(levels):
+                levels.append(
+                    level.scaled(
+                        half_w,
+                        half_h,
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+                )
+
+    def _display_pixmap(self, lod_key, target, sw, sh, interactive):
+        """Return ``target`` at exactly ``sw`` x ``sh`` when it is being minified.
+
+        The exact-size copy is built from the nearest mip level on idle frames
+        only and reused by later paints (including pans) at the same size; while
+        zooming, a pyramid level one step coarser is drawn and scaled by the
+        painter instead.
+        """
+        lod_w = sw // 2 if interactive else sw
+        if sw >= target.width() or sw * sh > 4 * max(1, self.width() * self.height()):
+            return self._lod_pixmap(lod_key, target, lod_w)
+        if interactive:
+            cached = _SCALED_CACHE.get((target.cacheKey(), sw, sh))
+            return cached if cached is not None else self._lod_pixmap(lod_key, target, lod_w)
+        return _scaled_pixmap(target, sw, sh, self._lod_pixmap(lod_key, target, sw))
+
+    def _paint_split(self, painter, target, rect, split_x, display_w):
+        before = self._lod_pixmap("before", self._before if self._before else target, display_w)
+        after = self._lod_pixmap("after", self._after if self._after else target, display_w)
+        if self._dragging_split or rect.width() * rect.height() > 4 * max(1, self.width() * self.height()):
+            # The split moves every frame while dragging; draw straight through.
+            self._draw_split_sources(painter, before, after, rect, split_x)
+        else:
+            painter.drawImage(rect.topLeft(), self._ensure_split_composed(before, after, rect, split_x))
         if self._show_guides:
             self._draw_texture_bounds(painter, rect)
         self._draw_split_handle(painter, split_x, rect)
 
-    def _draw_fitted_pixmap(self, painter, pixmap, area):
+    def _ensure_split_composed(self, before, after, rect, split_x):
+        """Composite both halves offscreen once so panning is a single blit."""
+        key = (rect.width(), rect.height(), split_x - rect.left(), before.cacheKey(), after.cacheKey())
+        if self._split_composed is not None and self._split_composed[0] == key:
+            return self._split_composed[1]
+        image = self._split_backing
+        if image is None or image.width() != rect.width() or image.height() != rect.height():
+            image = QImage(rect.width(), rect.height(), QImage.Format.Format_ARGB32_Premultiplied)
+            self._split_backing = image
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # The halves tile the whole image, so they overwrite the previous frame
+        # instead of clearing it and blending on top.
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        self._draw_split_sources(painter, before, after, image.rect(), split_x - rect.left())
+        painter.end()
+        self._split_composed = (key, image)
+        return image
+
+    def _draw_split_sources(self, painter, before, after, rect, split_x):
+        # Sample only the visible part of each source instead of drawing the
+        # full BEFORE pixmap and overdrawing it.
+        left_w = split_x - rect.left()
+        right_w = rect.right() - split_x + 1
+        frac = left_w / max(1, rect.width())
+        if before and left_w > 0:
+            target_rect = QRectF(float(rect.left()), float(rect.top()), float(left_w), float(rect.height()))
+            src_rect = QRectF(0.0, 0.0, before.width() * frac, before.height())
+            painter.drawPixmap(target_rect, before, src_rect)
+        if after and right_w > 0:
+            target_rect = QRectF(float(split_x), float(rect.top()), float(right_w), float(rect.height()))
+            src_x = after.width() * frac
+            src_rect = QRectF(src_x, 0.0, after.width() - src_x, after.height())
+            painter.drawPixmap(target_rect, after, src_rect)
+
+    def _draw_fitted_pixmap(self, painter, pixmap, area, lod_key, interactive=False):
         if pixmap is None or pixmap.isNull():
             return QRect()
         scale = min(area.width() / max(1, pixmap.width()), area.height() / max(1, pixmap.height())) * self._zoom
@@ -213,66 +684,90 @@ class TextureViewport(QWidget):
             sw,
             sh,
         )
-        painter.save()
-        painter.setClipRect(area)
-        painter.drawPixmap(rect, pixmap)
-        painter.restore()
+        visible = rect.intersected(area)
+        if visible.isEmpty():
+            return rect
+        # Draw only the visible part, mapped back to source pixels, instead of
+        # clipping a full draw to the panel.
+        source = self._display_pixmap(lod_key, pixmap, sw, sh, interactive)
+        fx, fy = source.width() / sw, source.height() / sh
+        src_rect = QRectF(
+            (visible.left() - rect.left()) * fx,
+            (visible.top() - rect.top()) * fy,
+            visible.width() * fx,
+            visible.height() * fy,
+        )
+        painter.drawPixmap(QRectF(visible), source, src_rect)
         return rect
 
-    def _draw_panel_backdrop(self, painter, area):
+    def _draw_panel_backdrops(self, painter, *areas):
         painter.save()
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(3, 5, 9, 150))
-        painter.drawRect(area)
+        painter.setBrush(self._backdrop_color)
+        for area in areas:
+            painter.drawRect(area)
         painter.restore()
 
     def _draw_texture_bounds(self, painter, rect):
         if rect.isNull() or rect.width() <= 1 or rect.height() <= 1:
             return
+        # The outline lies inside ``rect``, so no clip is needed.
         painter.save()
-        painter.setClipRect(rect)
-        painter.setPen(QPen(QColor(255, 255, 255, 42), 1, Qt.PenStyle.DashLine))
+        painter.setPen(self._bounds_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(rect.adjusted(0, 0, -1, -1))
         painter.restore()
 
     def _draw_tile_guides(self, painter, rect, tile_w, tile_h):
+        key = (rect.width(), rect.height(), tile_w, tile_h, self._tiles)
+        if key != self._guide_path_key:
+            right, bottom = rect.width() - 1, rect.height() - 1
+            path = QPainterPath()
+            path.addRect(0, 0, right, bottom)
+            for col in range(1, self._tiles):
+                path.moveTo(col * tile_w, 0)
+                path.lineTo(col * tile_w, bottom)
+            for row in range(1, self._tiles):
+                path.moveTo(0, row * tile_h)
+                path.lineTo(right, row * tile_h)
+            self._guide_path = path
+            self._guide_path_key = key
+        # Every segment lies inside ``rect``, so no clip is needed.
         painter.save()
-        painter.setClipRect(rect)
-        painter.setPen(QPen(QColor("#38d5c2"), 1, Qt.PenStyle.DashLine))
-        painter.drawRect(rect.adjusted(0, 0, -1, -1))
-        for col in range(1, self._tiles):
-            x = rect.left() + col * tile_w
-            painter.drawLine(x, rect.top(), x, rect.bottom())
-        for row in range(1, self._tiles):
-            y = rect.top() + row * tile_h
-            painter.drawLine(rect.left(), y, rect.right(), y)
+        painter.setPen(self._grid_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.translate(rect.topLeft())
+        painter.drawPath(self._guide_path)
         painter.restore()
 
     def _draw_split_handle(self, painter, split_x, rect):
         painter.save()
-        painter.setPen(QPen(QColor("#31e6bd"), 2))
+        painter.setPen(self._split_pen)
         painter.drawLine(split_x, rect.top(), split_x, rect.bottom())
-        handle_x = max(rect.left() + 4, min(rect.right() - 40, split_x - 18))
-        handle = QRect(handle_x, rect.bottom() - 42, 36, 28)
-        painter.setBrush(QColor("#101823"))
-        painter.setPen(QPen(QColor("#31e6bd"), 1))
+        origin = rect.topLeft()
+        handle, before_area, after_area = (area.translated(origin) for area in self._geom.chrome)
+        painter.setBrush(self._handle_color)
+        painter.setPen(self._handle_pen)
         painter.drawRoundedRect(handle, 6, 6)
-        painter.setPen(QColor("#dffdf8"))
-        painter.drawText(handle, Qt.AlignmentFlag.AlignCenter, "<>")
-        self._draw_corner_label(painter, QRect(rect.left(), rect.top(), split_x - rect.left(), rect.height()), "BEFORE")
-        self._draw_corner_label(painter, QRect(split_x, rect.top(), rect.right() - split_x + 1, rect.height()), "AFTER")
         painter.restore()
-
-    def _draw_corner_label(self, painter, rect, text):
-        if rect.isNull() or rect.width() < 48 or rect.height() < 24:
-            return
-        label = QRect(rect.left() + 10, rect.top() + 10, 68, 22)
+        self._draw_labels(painter, [(handle, "<>")], [(before_area, "BEFORE"), (after_area, "AFTER")])
+
+    def _draw_labels(self, painter, texts, corner_labels):
+        """Draw corner label chips, then every text in one pen state."""
+        chips = [
+            (QRect(rect.left() + 10, rect.top() + 10, 68, 22), text)
+            for rect, text in corner_labels
+            if not rect.isNull() and rect.width() >= 48 and rect.height() >= 24
+        ]
         painter.save()
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(4, 6, 10, 170))
-        painter.drawRoundedRect(label, 5, 5)
-        painter.setPen(QColor("#dffdf8"))
-        painter.drawText(label, Qt.AlignmentFlag.AlignCenter, text)
+        if chips:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._label_bg_color)
+            for label, _ in chips:
+                painter.drawRoundedRect(label, 5, 5)
+        painter.setPen(self._label_color)
+        for rect, text in texts + chips:
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
         painter.restore()
 
     def mousePressEvent(self, event):
@@ -291,7 +786,8 @@ class TextureViewport(QWidget):
         elif self._dragging_pan:
             self._pan += pos - self._last_mouse
             self._last_mouse = pos
-            self.update()
+            self._mark_interactive()
+            self._request_update()
         elif self._mode == "split" and self._is_on_split_handle(pos):
             self.setCursor(Qt.CursorShape.SplitHCursor)
         else:
@@ -302,37 +798,45 @@ class TextureViewport(QWidget):
             self.importRequested.emit()
 
     def mouseReleaseEvent(self, event):
+        was_dragging = self._dragging_pan or self._dragging_split
         self._dragging_pan = False
         self._dragging_split = False
+        if was_dragging:
+            # Repaint once at full resolution with smooth sampling.
+            self._idle_timer.stop()
+            self._interactive = False
+            self._schedule_update()
 
     def _is_on_split_handle(self, pos):
-        if self._last_content_rect.isNull():
+        geom = self._ensure_layout()
+        if geom is None:
             return False
-        split_x = self._last_content_rect.left() + int(self._last_content_rect.width() * self._split_ratio)
+        ox, oy = geom.x + self._pan.x(), geom.y + self._pan.y()
+        right, bottom = ox + geom.sw - 1, oy + geom.sh - 1
         edge_hit = (
-            self._last_content_rect.contains(pos)
-            and abs(pos.x() - split_x) <= 18
+            ox <= pos.x() <= right
+            and oy <= pos.y() <= bottom
+            and abs(pos.x() - ox - geom.split_offset) <= 18
         )
-        handle_hit = QRect(
-            max(self._last_content_rect.left() + 4, min(self._last_content_rect.right() - 40, split_x - 18)),
-            self._last_content_rect.bottom() - 42,
-            36,
-            28,
-        ).contains(pos)
-        return edge_hit or handle_hit
+        return edge_hit or (geom.chrome is not None and geom.chrome[0].translated(ox, oy).contains(pos))
 
     def _update_split_ratio(self, pos):
-        if self._last_content_rect.isNull():
+        geom = self._ensure_layout()
+        if geom is None:
             return
-        rel = (pos.x() - self._last_content_rect.left()) / max(1, self._last_content_rect.width())
+        rel = (pos.x() - geom.x - self._pan.x()) / max(1, geom.sw)
         self._split_ratio = max(0.0, min(1.0, rel))
-        self.update()
+        self._layout_dirty = True
+        self._mark_interactive()
+        self._request_update()
 
     def wheelEvent(self, event):
         delta = event.angleDelta().y() / 1200.0
         self._zoom = max(0.1, self._zoom + delta)
+        self._invalidate_layout()
         self.zoomChanged.emit(self._zoom)
-        self.update()
+        self._mark_interactive()
+        self._request_update()
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -838,6 +1342,11 @@ class ImageViewer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.maps: dict[str, QPixmap] = {}
+        self._conversion_pool = QThreadPool(self)
+        self._conversion_pool.setMaxThreadCount(1)
+        self._conversion_signals = _ConversionSignals(self)
+        self._conversion_signals.converted.connect(self._on_after_converted)
+        self._pending_after = None
         self._mode = "seamless"
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -929,8 +1438,11 @@ class ImageViewer(QWidget):
             self.studio.viewport2d.set_after_pixmap(base_pix)
 
     def set_workspace(self, index):
-        self.stack.setCurrentIndex(index)
         is_studio = index == 1
+        # Only the visible workspace's 2D viewport should process repaints.
+        self.classic.viewport.setUpdatesEnabled(not is_studio)
+        self.studio.viewport2d.setUpdatesEnabled(is_studio)
+        self.stack.setCurrentIndex(index)
         self.mode_badge.setText("STUDIO MODE" if is_studio else "CLASSIC MODE")
         self.toggle_btn.setText("Switch to Classic" if is_studio else "Switch to Studio")
         self._update_bottom_bar()
@@ -951,26 +1463,59 @@ class ImageViewer(QWidget):
     def set_before_image(self, img):
         pix = numpy_to_pixmap(img)
         self.maps["Base Color"] = pix
-        self.classic.viewport.set_before_image(img)
+        self.classic.viewport.set_before_pixmap(pix)
         self.studio.viewport3d.set_material_map("Base Color", img)
-        self.studio.viewport2d.set_before_image(img)
+        self.studio.viewport2d.set_before_pixmap(pix)
         self.map_selector.set_channel("Base Color", pix)
         if self.map_selector.checked_name() == "Base Color":
             self.studio.viewport2d.set_after_pixmap(pix)
 
-    def set_after_image(self, img):
-        pix = numpy_to_pixmap(img)
-        self.maps["Base Color"] = pix
-        self.classic.viewport.set_after_image(img)
+    def set_after_image(self, img, qimage=None):
+        """Show ``img`` as the processed result.
+
+        ``qimage`` is an already converted native-format copy of ``img`` (see
+        numpy_to_native_qimage), which skips the conversion here.
+        """
+        signals = self._conversion_signals
+        signals.latest += 1
+        self._pending_after = None
         self.studio.viewport3d.set_material_map("Base Color", img)
-        self.studio.viewport2d.set_after_image(img)
+        if qimage is not None:
+            self._apply_after_pixmap(QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion))
+            return
+        if (
+            img is not None
+            and img.shape[0] * img.shape[1] >= _ASYNC_CONVERT_MIN_PIXELS
+            and _cached_pixmap(img) is None
+        ):
+            # Large frames: keep the GUI thread responsive and show the
+            # pixmap when the worker finishes (stale generations are dropped).
+            self._pending_after = img
+            self._conversion_pool.start(_ConversionTask(img, signals.latest, signals))
+            return
+        self._apply_after_pixmap(numpy_to_pixmap(img))
+
+    def _on_after_converted(self, generation, qimg):
+        if generation != self._conversion_signals.latest:
+            return
+        pix = QPixmap.fromImage(qimg, Qt.ImageConversionFlag.NoFormatConversion)
+        img, self._pending_after = self._pending_after, None
+        if img is not None:
+            _remember_pixmap(id(img), img, _pixmap_signature(img), pix)
+        self._apply_after_pixmap(pix)
+
+    def _apply_after_pixmap(self, pix):
+        self.maps["Base Color"] = pix
+        self.classic.viewport.set_after_pixmap(pix)
+        self.studio.viewport2d.set_after_pixmap(pix)
         self.map_selector.set_channel("Base Color", pix)
-        if self.map_selector.checked_name() == "Base Color":
-            self.studio.viewport2d.set_after_pixmap(pix)
 
     def set_map(self, name, img):
         if name == "Displacement":
             name = "Height"
+        if name == "Base Color" and img is not None and img is self._pending_after:
+            # set_after_image is already converting this frame.
+            return
         pix = numpy_to_pixmap(img)
         self.maps[name] = pix
         self.map_selector.set_channel(name, pix)
@@ -978,7 +1523,7 @@ class ImageViewer(QWidget):
         if name == self.map_selector.checked_name():
             self.studio.viewport2d.set_after_pixmap(pix)
             self.classic.viewport.set_after_pixmap(pix)
-        if name == "Base Color":
+        elif name == "Base Color":
             self.classic.viewport.set_after_pixmap(pix)
 
     def _on_map_changed(self, name):
@@ -1007,4 +1552,7 @@ class ImageViewer(QWidget):
         self.studio.viewport2d.set_show_guides(show)
 
     def cleanup(self):
+        self._conversion_signals.latest += 1
+        self._conversion_pool.clear()
+        self._conversion_pool.waitForDone(2000)
         self.studio.viewport3d.cleanup()
@@ -2,11 +2,13 @@
 import collections
 import os
 import sys
+import threading
 import time
+from types import MappingProxyType
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import QMutex, QByteArray, QRect, QThread, QTimer, Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, QMutex, QByteArray, QRect, QThread, QTimer, QWaitCondition, Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QColor, QFont, QPainter, QPen, QPixmap, QShortcut, QKeySequence
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import (
@@ -27,10 +29,11 @@ from PyQt6.QtWidgets import (
 )
 
 from .controls import ControlPanel, PreprocessingPanel
-from .image_viewer import ImageViewer, numpy_to_pixmap
+from .image_viewer import ImageViewer, numpy_to_native_qimage, numpy_to_pixmap
 from .normal_controls import MaterialControlPanel
 from .styles import get_dark_theme
 from .system_monitor import StatusBarMonitor
+from ..core.exceptions import PreviewCanceled
 from ..core.normal_generator import NormalGenerator
 from ..core.seamless import SeamlessProcessor
 from ..utils.app_logging import get_logger, log_exception
@@ -48,6 +51,32 @@ from ..utils.image_io import (
 
 logger = get_logger(__name__)
 
+# Frame budget for live slider previews, shared by compute time and timer wait.
+_PREVIEW_FRAME_MS = 24
+_PREVIEW_MIN_WAIT_MS = 4
+# Downscale factors of the rough (stage 1) and medium (stage 2) previews.
+_PREVIEW_STAGE1_SCALE = 0.125
+_PREVIEW_STAGE2_SCALE = 0.5
+
+
+def _preview_wait_ms(delays_ms) -> int:
+    """Predict the next preview's compute time and return the wait that fills the budget.
+
+    A low-degree trend fitted to the recent delays follows a drag that is
+    getting heavier or lighter; the prediction is clamped to the observed range
+    so a noisy fit never extrapolates past it.
+    """
+    if not delays_ms:
+        return _PREVIEW_FRAME_MS
+    samples = np.asarray(delays_ms, dtype=np.float64)
+    if len(samples) < 3:
+        predicted = float(samples[-1])
+    else:
+        x = np.arange(len(samples))
+        coeffs = np.polyfit(x, samples, 2)
+        predicted = float(np.clip(np.polyval(coeffs, len(samples)), samples.min(), samples.max()))
+    return int(max(_PREVIEW_FRAME_MS - predicted, _PREVIEW_MIN_WAIT_MS))
+
 
 def _current_exe_path() -> str:
     if getattr(sys, "frozen", False):
@@ -56,86 +85,193 @@ def _current_exe_path() -> str:
 
 
 class ProcessingThread(QThread):
-    finished = pyqtSignal(object, float, int)
-    error = pyqtSignal(str, int)
-
-    def __init__(self, image, params, generation, parent=None):
-        super().__init__(parent)
-        self.image = image.copy()
-        self.params = params.copy()
-        self.generation = generation
+    """Long-lived full-resolution worker; jobs are handed over with submit()."""
 
-    def run(self):
-        try:
-            t0 = time.time()
-            processor = SeamlessProcessor()
-            processor.load_image(self.image)
-            processor.set_parameters(**self.params)
-            result = processor.process()
-            self.finished.emit(result, time.time() - t0, self.generation)
-        except Exception as exc:
-            log_exception(logger, "Texture processing failed", exc)
-            self.error.emit(str(exc), self.generation)
-
-
-class PreviewThread(QThread):
-    result_ready = pyqtSignal(object, int)
+    # (result array, native-format QImage of it, seconds, generation)
+    finished = pyqtSignal(object, object, float, int)
     error = pyqtSignal(str, int)
 
-    def __init__(self):
-        super().__init__()
-        self.image = None
-        self.params = None
-        self.generation = 0
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self._mutex = QMutex()
-        self._restart = False
+        self._job_ready = QWaitCondition()
+        self._idle = QWaitCondition()
+        self._job = None
+        self._busy = False
         self._abort = False
 
-    def request(self, image, params, generation):
+    def submit(self, image, params, generation):
+        """Queue a job, replacing any job that has not started yet."""
         self._mutex.lock()
-        self.image = image.copy()
-        self.params = params.copy()
-        self.generation = generation
-        self._restart = True
+        if self._abort:
+            self._mutex.unlock()
+            return
+        self._job = (image.copy(), params.copy(), generation)
+        self._busy = True
+        self._job_ready.wakeOne()
         self._mutex.unlock()
         if not self.isRunning():
             self.start()
 
+    def is_busy(self):
+        self._mutex.lock()
+        busy = self._busy
+        self._mutex.unlock()
+        return busy
+
+    def wait_idle(self, msecs):
+        """Block up to ``msecs`` for the current job; return True once idle."""
+        self._mutex.lock()
+        if self._busy:
+            self._idle.wait(self._mutex, msecs)
+        busy = self._busy
+        self._mutex.unlock()
+        return not busy
+
+    def _is_superseded(self):
+        # Read without the lock: a stale answer only delays the abort.
+        return self._job is not None or self._abort
+
     def stop(self):
+        """Shut the worker down for good; later submits are ignored."""
         self._mutex.lock()
         self._abort = True
-        self._restart = True
+        self._job = None
+        self._job_ready.wakeOne()
+        self._mutex.unlock()
+
+    def resume(self):
+        """Undo stop() when the window refuses to close after all."""
+        self._mutex.lock()
+        self._abort = False
         self._mutex.unlock()
 
     def run(self):
         while True:
             self._mutex.lock()
-            abort = self._abort
-            image = None if self.image is None else self.image.copy()
-            params = None if self.params is None else self.params.copy()
-            generation = self.generation
-            self._restart = False
+            while self._job is None and not self._abort:
+                self._job_ready.wait(self._mutex)
+            if self._abort:
+                self._busy = False
+                self._idle.wakeAll()
+                self._mutex.unlock()
+                return
+            image, params, generation = self._job
+            self._job = None
             self._mutex.unlock()
-            if abort or image is None or params is None:
-                break
-            if params:
-                try:
-                    processor = SeamlessProcessor()
-                    processor.load_image(image)
-                    result = processor.process(preview=True, params=params)
-                    self._mutex.lock()
-                    restart = self._restart or self._abort
-                    self._mutex.unlock()
-                    if not restart:
-                        self.result_ready.emit(result, generation)
-                except Exception as exc:
-                    log_exception(logger, "Live preview failed", exc)
-                    self.error.emit(str(exc), generation)
+            result = error = None
+            try:
+                t0 = time.time()
+                processor = SeamlessProcessor()
+                processor.load_image(image)
+                processor.set_parameters(**params)
+                result = processor.process(is_canceled=self._is_superseded)
+                elapsed = time.time() - t0
+                # Convert here so the GUI thread only wraps the QImage in a pixmap.
+                qimage = numpy_to_native_qimage(result)
+            except PreviewCanceled:
+                pass
+            except Exception as exc:
+                log_exception(logger, "Texture processing failed", exc)
+                error = str(exc)
             self._mutex.lock()
-            done = not self._restart or self._abort
+            if self._job is None:
+                self._busy = False
+                self._idle.wakeAll()
             self._mutex.unlock()
-            if done:
+            # Emit only once idle, so the slot already sees is_busy() False.
+            if error is not None:
+                self.error.emit(error, generation)
+            elif result is not None:
+                self.finished.emit(result, qimage, elapsed, generation)
+
+
+class PreviewThread(QThread):
+    # (full-size result array, native-format QImage of it, generation, scale,
+    # compute time in ms)
+    result_ready = pyqtSignal(object, object, int, float, float)
+    error = pyqtSignal(str, int)
+
+    def __init__(self):
+        super().__init__()
+        # Only the newest (image, params, generation, scale) request is kept;
+        # the GUI thread is the sole producer, so deque append/pop need no lock.
+        self._pending = collections.deque(maxlen=1)
+        self._abort = False
+        # scale -> (source image, SeamlessProcessor); only touched by run().
+        self._processors = {}
+        self.finished.connect(self._restart_if_pending)
+
+    def request(self, image, params, generation, scale=1.0):
+        """Queue a preview of ``image`` downscaled by ``scale`` with ``params``.
+
+        Both are handed over rather than copied: callers pass a freshly built
+        params dict, and ``image_np`` is only ever replaced, never written in
+        place. The mapping proxy keeps the worker from mutating the dict.
+        """
+        self._pending.append((image, MappingProxyType(params), generation, scale))
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        self._abort = True
+        self._pending.clear()
+
+    def _is_superseded(self):
+        # A pending entry is always a newer generation than the one running.
+        return bool(self._pending) or self._abort
+
+    def _restart_if_pending(self):
+        # A request that landed while run() was returning would otherwise wait
+        # for the next slider tick.
+        if self._pending and not self._abort:
+            self.start()
+
+    def _processor(self, image, scale):
+        """Return a processor holding ``image`` downscaled by ``scale``.
+
+        The downscale, hash and preview cache are built once per image and
+        scale, so slider ticks only run the pipeline.
+        """
+        entry = self._processors.get(scale)
+        if entry is not None and entry[0] is image:
+            return entry[1]
+        processor = entry[1] if entry is not None else SeamlessProcessor()
+        h, w = image.shape[:2]
+        # SeamlessProcessor rejects sides under 64 px; the entry stays keyed
+        # on the requested scale.
+        factor = min(1.0, max(scale, 64 / min(h, w)))
+        small_w = max(1, int(w * factor))
+        small_h = max(1, int(h * factor))
+        processor.load_image(cv2.resize(image, (small_w, small_h), interpolation=cv2.INTER_AREA))
+        self._processors[scale] = (image, processor)
+        return processor
+
+    def run(self):
+        while not self._abort:
+            try:
+                image, params, generation, scale = self._pending.pop()
+            except IndexError:
                 break
+            if not params:
+                continue
+            try:
+                t0 = time.perf_counter()
+                processor = self._processor(image, scale)
+                result = processor.process(preview=True, params=params, is_canceled=self._is_superseded)
+                h, w = image.shape[:2]
+                if result.shape[0] != h or result.shape[1] != w:
+                    result = cv2.resize(result, (w, h), interpolation=cv2.INTER_LINEAR)
+                # Convert here so the GUI thread only wraps the QImage in a pixmap.
+                qimage = numpy_to_native_qimage(result)
+                compute_ms = (time.perf_counter() - t0) * 1000.0
+                if not self._is_superseded():
+                    self.result_ready.emit(result, qimage, generation, scale, compute_ms)
+            except PreviewCanceled:
+                continue
+            except Exception as exc:
+                log_exception(logger, "Live preview failed", exc)
+                self.error.emit(str(exc), generation)
 
 
 class MaterialMapThread(QThread):
@@ -162,6 +298,7 @@ class MaterialMapThread(QThread):
             self.start()
 
     def stop(self):
+        """Shut the worker down for good; later submits are ignored."""
         self._mutex.lock()
         self._abort = True
         self._restart = True
@@ -896,15 +1033,46 @@ class MaterialSphereCard(PreviewCard):
         return (id(image), image.shape, str(image.dtype))
 
 class MainWindow(QMainWindow):
-    def _on_preview_ready(self, result, generation):
-        if generation == self._preview_generation and result is not None:
-            self.image_viewer.set_after_image(result)
-            if self.processed_normal_map is not None:
-                self.image_viewer.set_map("Normal", self.processed_normal_map)
+    def _on_preview_ready(self, result, qimage, generation, scale, compute_ms):
+        self._preview_landed(generation)
+        if generation != self._preview_generation or result is None:
+            return
+        if not self._preview_visible():
+            # Nothing would be drawn; keep the frame for when the window is restored.
+            self._hidden_preview = (result, qimage)
+            return
+        self._hidden_preview = None
+        self.image_viewer.set_after_image(result, qimage)
+        if self.processed_normal_map is not None:
+            self.image_viewer.set_map("Normal", self.processed_normal_map)
+        if scale == _PREVIEW_STAGE1_SCALE:
+            self._preview_delays.append(compute_ms)
+        self._advance_progressive_preview(scale)
+
+    def _preview_landed(self, generation):
+        if self._preview_in_flight is not None and self._preview_in_flight[0] == generation:
+            self._preview_in_flight = None
+
+    def _advance_progressive_preview(self, scale):
+        if self._preview_dirty:
+            # Parameters moved while this frame was computing.
+            self._preview_dirty = False
+            self._schedule_progressive_preview()
+        elif scale == _PREVIEW_STAGE1_SCALE:
+            self._preview_stage2_timer.start()
+        else:
+            self._on_stage2_preview_ready()
+
+    def _preview_visible(self):
+        return self.isVisible() and not self.isMinimized() and self.image_viewer.isVisible()
 
     def _on_preview_error(self, msg, generation):
+        in_flight = self._preview_in_flight
+        self._preview_landed(generation)
         if generation == self._preview_generation:
             logger.warning("Preview skipped: %s", msg)
+            if in_flight is not None:
+                self._advance_progressive_preview(in_flight[1])
 
     def __init__(self):
         super().__init__()
@@ -913,21 +1081,36 @@ class MainWindow(QMainWindow):
         self.image_metadata = None
         self.loading_threads = []
         self.export_thread = None
-        self.processing_thread = None
+        # Worker results are always queued so emit() never waits on GUI slots.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.processing_thread = ProcessingThread(self)
+        self.processing_thread.finished.connect(self._on_processing_finished, queued)
+        self.processing_thread.error.connect(self._on_processing_error, queued)
         self.preview_thread = PreviewThread()
-        self.preview_thread.result_ready.connect(self._on_preview_ready)
-        self.preview_thread.error.connect(self._on_preview_error)
+        self.preview_thread.result_ready.connect(self._on_preview_ready, queued)
+        self.preview_thread.error.connect(self._on_preview_error, queued)
         self.material_thread = MaterialMapThread(self)
-        self.material_thread.maps_ready.connect(self._on_material_maps_ready)
-        self.material_thread.error.connect(self._on_material_maps_error)
+        self.material_thread.maps_ready.connect(self._on_material_maps_ready, queued)
+        self.material_thread.error.connect(self._on_material_maps_error, queued)
         self.image_np = None
         self.material_maps = {}
         self.processed_normal_map = None
-        self._pending_reprocess = False
         self._ignore_next_processing_result = False
         self._load_generation = 0
         self._processing_generation = 0
         self._preview_generation = 0
+        self._hidden_preview = None
+        # Full resolution runs once a stage-2 preview lands with the
+        # parameters unchanged for at least that preview's compute time.
+        self._fullres_pending = False
+        self._last_params_change = 0.0
+        # Compute time (ms) of the last stage-1 previews, for pacing the next one.
+        self._preview_delays = collections.deque(maxlen=10)
+        # (generation, scale) of the preview the worker is computing, if any.
+        # Stage 1 keeps one frame in flight; ticks in the meantime set dirty.
+        self._preview_in_flight = None
+        self._preview_dirty = False
+        self._stage2_requested_at = 0.0
         self._material_generation = 0
         self._active_mode = "seamless"
         # Undo / Redo stacks store numpy image snapshots.
@@ -1004,8 +1187,23 @@ class MainWindow(QMainWindow):
     def _setup_menu(self):
         mb = self.menuBar()
         mb.clear()
+        # Menus are filled the first time they open; the key bindings live in
+        # _setup_shortcuts, so nothing is lost until then.
+        for title, populate in [
+            ("&File", self._populate_file_menu),
+            ("&Edit", self._populate_edit_menu),
+            ("&View", self._populate_view_menu),
+            ("&Help", self._populate_help_menu),
+            ("&About", self._populate_about_menu),
+        ]:
+            menu = mb.addMenu(title)
+            menu.aboutToShow.connect(lambda menu=menu, populate=populate: self._populate_menu_once(menu, populate))
+
+    def _populate_menu_once(self, menu, populate):
+        if menu.isEmpty():
+            populate(menu)
 
-        fm = mb.addMenu("&File")
+    def _populate_file_menu(self, fm):
         self._add_menu_action(fm, "&Open Texture...", "Ctrl+O", self._open_file)
         fm.addSeparator()
         self._add_menu_action(fm, "&Save Current Texture", "Ctrl+S", self._save_file)
@@ -1015,16 +1213,15 @@ class MainWindow(QMainWindow):
         fm.addSeparator()
         self._add_menu_action(fm, "E&xit", "Alt+F4", self.close)
 
-        edit = mb.addMenu("&Edit")
+    def _populate_edit_menu(self, edit):
         self._undo_action = self._add_menu_action(edit, "&Undo", "Ctrl+Z", self._undo)
         self._redo_action = self._add_menu_action(edit, "&Redo", "Ctrl+Y", self._redo)
-        self._undo_action.setEnabled(False)
-        self._redo_action.setEnabled(False)
+        self._update_undo_actions()
         edit.addSeparator()
         self._add_menu_action(edit, "Reset &View", "Ctrl+0", self.image_viewer.fit_to_view)
         self._add_menu_action(edit, "Apply &Delight", "", self._apply_delight)
 
-        view = mb.addMenu("&View")
+    def _populate_view_menu(self, view):
         self._add_menu_action(view, "&Delight", "1", lambda: self._on_nav_changed("delight"))
         self._add_menu_action(view, "&Seamless", "2", lambda: self._on_nav_changed("seamless"))
         self._add_menu_action(view, "&Material Lab", "3", lambda: self._on_nav_changed("material"))
@@ -1032,17 +1229,19 @@ class MainWindow(QMainWindow):
         self._add_menu_action(view, "Classic Mode", "", self._on_classic_mode_requested)
         self._add_menu_action(view, "Studio Mode", "", self._on_studio_mode_requested)
 
-        help_menu = mb.addMenu("&Help")
+    def _populate_help_menu(self, help_menu):
         self._add_menu_action(help_menu, "&Keyboard Shortcuts", "F1", self._show_shortcuts)
         self._add_menu_action(help_menu, "Check for &Updates", "", self._start_update_check)
 
-        about_menu = mb.addMenu("&About")
+    def _populate_about_menu(self, about_menu):
         self._add_menu_action(about_menu, "About &SEAMS", "", self._show_about)
 
     def _add_menu_action(self, menu, label, shortcut, slot):
         action = QAction(label, self)
         if shortcut:
+            # Shown in the menu only; the window-wide QShortcut handles the key.
             action.setShortcut(shortcut)
+            action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
         action.triggered.connect(slot)
         menu.addAction(action)
         return action
@@ -1294,8 +1493,7 @@ class MainWindow(QMainWindow):
 
     def _restore_image_state(self, action_name: str):
         """Reload processor + viewer after an undo/redo step."""
-        self.update_timer.stop()
-        self.fullres_timer.stop()
+        self._cancel_progressive_preview()
         self._processing_generation += 1
         self._preview_generation += 1
         self._material_generation += 1
@@ -1303,7 +1501,6 @@ class MainWindow(QMainWindow):
         self.material_maps["Base Color"] = self.image_np.copy()
         self.image_viewer.set_before_image(self.image_np)
         self.image_viewer.set_after_image(self.image_np)
-        self.image_viewer.set_map("Base Color", self.image_np)
         self.image_viewer.select_map("Base Color")
         self._on_normal_live_update()
         steps = len(self._undo_stack)
@@ -1311,7 +1508,7 @@ class MainWindow(QMainWindow):
             f"{action_name}  —  {steps} step{'s' if steps != 1 else ''} remaining", 3000
         )
         # Kick off a full-res re-process in the background
-        QTimer.singleShot(80, self._process_texture)
+        self._process_texture()
 
     def _setup_shortcuts(self):
         QShortcut(QKeySequence("Ctrl+O"), self).activated.connect(self._open_file)
@@ -1372,15 +1569,12 @@ class MainWindow(QMainWindow):
         vbox.setSpacing(0)
         vbox.addWidget(holder, 1)
         vbox.addWidget(self.bottom_bar, 0)
-        self.update_timer = QTimer()
-        self.update_timer.setSingleShot(True)
-        self.update_timer.setInterval(24)
-        self.update_timer.timeout.connect(self._request_live_preview)
-
         # ── 3-Stage Progressive Preview Timers ─────────────────────────
-        # Stage 1: immediate (0ms, scale=0.125) → rough instant preview
+        # Stages 1 and 2 run on the preview thread; each starts the next when
+        # its frame lands.
+        # Stage 1: adaptive 4-24ms pacing (scale=0.125) → rough instant preview
         # Stage 2: 80ms debounce (scale=0.5) → medium quality
-        # Stage 3: 400ms debounce (scale=1.0) → full resolution
+        # Stage 3: after stage 2 once parameters are stable (scale=1.0) → full resolution
         self._preview_stage1_timer = QTimer()
         self._preview_stage1_timer.setSingleShot(True)
         self._preview_stage1_timer.setInterval(0)
@@ -1397,10 +1591,6 @@ class MainWindow(QMainWindow):
         ]
         self._current_preview_scale: float = 1.0
 
-        self.fullres_timer = QTimer()
-        self.fullres_timer.setSingleShot(True)
-        self.fullres_timer.setInterval(400)
-        self.fullres_timer.timeout.connect(self._process_texture)
 
     def statusBar(self):
         class _FakeSB:
@@ -1474,8 +1664,7 @@ class MainWindow(QMainWindow):
         path = os.path.abspath(os.path.expanduser(str(path)))
         self._load_generation += 1
         generation = self._load_generation
-        self.update_timer.stop()
-        self.fullres_timer.stop()
+        self._cancel_progressive_preview()
         self.progress.setRange(0, 0)
         self.progress.show()
         self.statusBar().showMessage("Loading texture...")
@@ -1527,7 +1716,8 @@ class MainWindow(QMainWindow):
             self.setWindowTitle(f"SEAMS - {name}")
             self._on_nav_changed("seamless")
             self.progress.hide()
-            QTimer.singleShot(120, self._process_texture)
+            # ProcessingThread runs off the GUI thread, so start it right away.
+            self._process_texture()
         except Exception as exc:
             log_exception(logger, f"Failed to finalize loaded image {path}", exc)
             self.progress.hide()
@@ -1547,68 +1737,76 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Open Texture", f"Could not open this texture:\n{path}\n\n{msg}")
 
     def _on_parameters_changed(self):
-        self.fullres_timer.stop()
-        self.fullres_timer.start()
+        self._last_params_change = time.monotonic()
+        self._fullres_pending = True
+        self._schedule_progressive_preview()
+
+    def _cancel_progressive_preview(self):
+        self._fullres_pending = False
+        self._preview_dirty = False
+        for timer in self._preview_stage_timers:
+            timer.stop()
 
     def _on_live_preview_requested(self):
         if self._active_mode == "material":
             self._on_normal_live_update()
             return
-        if self.processor.original_image is not None:
-            self.fullres_timer.stop()
-            # Cancel higher stages and restart from stage 1
+        self._schedule_progressive_preview()
+
+    def _schedule_progressive_preview(self):
+        if self.processor.has_image:
+            # Cancel higher stages; pace stage 1 so compute plus wait fits one frame.
             self._preview_stage2_timer.stop()
-            self._preview_stage1_timer.start()
+            if not self._preview_stage1_timer.isActive():
+                self._preview_stage1_timer.setInterval(_preview_wait_ms(self._preview_delays))
+                self._preview_stage1_timer.start()
 
     def _request_preview_stage1(self):
-        """Stage 1: immediate, scale=0.125 for rough instant preview."""
-        self._process_at_scale(0.125)
-        self._preview_stage2_timer.start()
+        """Stage 1: paced to the frame budget, scale=0.125 for rough instant preview."""
+        if self._preview_in_flight is not None and self._preview_in_flight[1] == _PREVIEW_STAGE1_SCALE:
+            # The landing frame reschedules with the latest parameters.
+            self._preview_dirty = True
+            return
+        self._request_preview(_PREVIEW_STAGE1_SCALE)
 
     def _request_preview_stage2(self):
-        """Stage 2: 80ms debounce, scale=0.5 for medium quality."""
-        self._process_at_scale(0.5)
+        """Stage 2: 80ms debounce, scale=0.5 for medium quality; then full resolution."""
+        self._stage2_requested_at = time.monotonic()
+        self._request_preview(_PREVIEW_STAGE2_SCALE)
 
-    def _process_at_scale(self, scale: float):
-        """Process the texture at a reduced scale and display the result."""
-        if self.image_np is None:
+    def _on_stage2_preview_ready(self):
+        if not self._fullres_pending:
             return
-        import cv2
-        h, w = self.image_np.shape[:2]
-        small_w = max(1, int(w * scale))
-        small_h = max(1, int(h * scale))
-        small = cv2.resize(self.image_np, (small_w, small_h), interpolation=cv2.INTER_AREA)
-        params = self.control_panel.get_parameters()
-        params["preprocessing"] = self.pre_panel.get_parameters()
-        try:
-            processor = self.processor
-            processor.load_image(small)
-            result = processor.process(preview=True, params=params)
-            if result is not None:
-                if result.shape[0] != h or result.shape[1] != w:
-                    result = cv2.resize(result, (w, h), interpolation=cv2.INTER_LINEAR)
-                self.image_viewer.set_after_image(result)
-        except Exception as exc:
-            import logging
-            logging.getLogger("seams.preview").debug("stage preview failed at scale %.3f: %s", scale, exc)
-        # Reload original-resolution image for subsequent full-res processing
-        self.processor.load_image(self.image_np)
+        now = time.monotonic()
+        # Full resolution only once the parameters have held still for at
+        # least as long as this preview took; otherwise try stage 2 again.
+        elapsed = now - self._stage2_requested_at
+        if now - self._last_params_change >= elapsed and self._preview_in_flight is None:
+            self._fullres_pending = False
+            self._process_texture()
+        else:
+            self._preview_stage2_timer.start()
+
+    def _request_preview(self, scale: float):
+        """Queue a preview of the texture at a reduced scale on the preview thread.
 
-    def _request_live_preview(self):
+        A newer request cancels a running one, so a slider tick aborts a
+        stage-2 frame that is still computing.
+        """
+        if self.image_np is None or not self._preview_visible():
+            return
         params = self.control_panel.get_parameters()
         params["preprocessing"] = self.pre_panel.get_parameters()
-        if self.image_np is not None:
-            self._preview_generation += 1
-            self.preview_thread.request(self.image_np, params, self._preview_generation)
+        self._preview_generation += 1
+        self._preview_in_flight = (self._preview_generation, scale)
+        self.preview_thread.request(self.image_np, params, self._preview_generation, scale)
 
     def _apply_delight(self):
         if self.image_np is None:
             return
-        self.update_timer.stop()
-        self.fullres_timer.stop()
-        if self.processing_thread and self.processing_thread.isRunning():
+        self._cancel_progressive_preview()
+        if self.processing_thread.is_busy():
             self._ignore_next_processing_result = True
-            self._pending_reprocess = False
             self._processing_generation += 1
         params = self.pre_panel.get_parameters()
         strength = float(params.get("delight", 0.0))
@@ -1629,12 +1827,10 @@ class MainWindow(QMainWindow):
         self.processor.load_image(self.image_np)
         
         self.pre_panel._on_reset()
-        self.update_timer.stop()
-        self.fullres_timer.stop()
+        self._cancel_progressive_preview()
         
         self.image_viewer.set_before_image(self.image_np)
         self.image_viewer.set_after_image(self.image_np)
-        self.image_viewer.set_map("Base Color", self.image_np)
         self.material_maps["Base Color"] = self.image_np.copy()
         self.image_viewer.select_map("Base Color")
         self.image_viewer.set_delighted_image(None)
@@ -1645,33 +1841,31 @@ class MainWindow(QMainWindow):
     def _process_texture(self):
         if self.image_np is None:
             return
-        if self.processing_thread and self.processing_thread.isRunning():
-            self._pending_reprocess = True
-            return
-        self._pending_reprocess = False
+        # Always submit: the worker replaces a job that has not started and
+        # cancels the running one, so bursts collapse to the newest parameters.
         self.progress.setRange(0, 0)
         self.progress.show()
         params = self.control_panel.get_parameters()
         params["preprocessing"] = self.pre_panel.get_parameters()
         self.processor.set_parameters(**params)
+        # The new generation already drops the running job's result, which
+        # may now be canceled instead of ever reaching the slot.
+        self._ignore_next_processing_result = False
         self._processing_generation += 1
         generation = self._processing_generation
-        self.processing_thread = ProcessingThread(self.image_np, params, generation, self)
-        self.processing_thread.finished.connect(self._on_processing_finished)
-        self.processing_thread.error.connect(self._on_processing_error)
-        self.processing_thread.start()
+        self.processing_thread.submit(self.image_np, params, generation)
 
-    def _on_processing_finished(self, result, elapsed, generation):
-        self.progress.hide()
+    def _on_processing_finished(self, result, qimage, elapsed, generation):
         if generation != self._processing_generation or self._ignore_next_processing_result:
             self._ignore_next_processing_result = False
+            if not self.processing_thread.is_busy():
+                self.progress.hide()
             self.statusBar().showMessage("Skipped stale processing result", 1800)
-            if self._pending_reprocess:
-                self._process_texture()
             return
+        self.progress.hide()
         self.processor.set_processed_image(result)
-        self.image_viewer.set_after_image(result)
-        self.image_viewer.set_map("Base Color", result)
+        self._hidden_preview = None
+        self.image_viewer.set_after_image(result, qimage)
         self.material_maps["Base Color"] = result.copy()
         self.control_panel.set_processed(True)
         
@@ -1685,8 +1879,6 @@ class MainWindow(QMainWindow):
             self.control_stack.setCurrentIndex(1)
 
         self.statusBar().showMessage(f"Done ({elapsed:.2f}s)", 3000)
-        if self._pending_reprocess:
-            self._process_texture()
 
     def _on_processing_error(self, msg, generation):
         if generation != self._processing_generation:
@@ -1906,7 +2098,9 @@ class MainWindow(QMainWindow):
         self._save_window_geometry()
         self.settings["active_tool"] = self._active_mode
         self.settings.update(self.control_panel.get_parameters())
-        save_settings(self.settings)
+        # Write settings while the worker threads below wind down; the
+        # non-daemon thread keeps the interpreter alive until the file is saved.
+        threading.Thread(target=save_settings, args=(dict(self.settings),), name="seams-save-settings").start()
         if hasattr(self, "_monitor"):
             self._monitor.stop()
         if self.preview_thread.isRunning():
@@ -1934,10 +2128,13 @@ class MainWindow(QMainWindow):
                 )
                 event.ignore()
                 return
-        if self.processing_thread and self.processing_thread.isRunning():
+        # Cancel rather than finish the running job; its result would be
+        # discarded anyway, and the abort is seen at the next stage or tile.
+        self.processing_thread.stop()
+        if self.processing_thread.is_busy():
             self._ignore_next_processing_result = True
-            self.processing_thread.wait(3000)
-            if self.processing_thread.isRunning():
+            if not self.processing_thread.wait_idle(3000):
+                self.processing_thread.resume()
                 QMessageBox.warning(
                     self,
                     "Processing In Progress",
@@ -1945,6 +2142,7 @@ class MainWindow(QMainWindow):
                 )
                 event.ignore()
                 return
+        self.processing_thread.wait()
         if hasattr(self, "image_viewer"):
             self.image_viewer.cleanup()
         event.accept()
@@ -2028,6 +2226,20 @@ class MainWindow(QMainWindow):
                     ny = avail.y() + (avail.height() - nh) // 2
                     self.setGeometry(nx, ny, nw, nh)
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() != QEvent.Type.WindowStateChange:
+            return
+        if self.isMinimized():
+            for timer in self._preview_stage_timers:
+                timer.stop()
+            return
+        if self._hidden_preview is not None:
+            frame, self._hidden_preview = self._hidden_preview, None
+            self.image_viewer.set_after_image(*frame)
+        if self._fullres_pending:
+            self._schedule_progressive_preview()
+
     def moveEvent(self, event):
         super().moveEvent(event)
 
@@ -9,10 +9,10 @@ mesh switching, tiling, and channel isolation.
 from __future__ import annotations
 
 import math
+import sys
 import time
 from dataclasses import dataclass
 
-import cv2
 import numpy as np
 from PyQt6.QtCore import QPoint, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import (
@@ -127,22 +127,24 @@ class TextureRecord:
 
 
 def numpy_to_qimage(image: np.ndarray | None) -> QImage:
-    """Create an owned RGB/RGBA QImage from an OpenCV/numpy image."""
+    """Create an owned QImage from an OpenCV/numpy image.
+
+    Qt reads BGR/BGRA bytes directly, so no channel swap is needed on
+    little-endian hosts.
+    """
     if image is None:
         return QImage()
-    if len(image.shape) == 2:
-        rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+    if image.ndim == 2:
+        fmt = QImage.Format.Format_Grayscale8
     elif image.shape[2] == 4:
-        rgb = cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA)
-    else:
-        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-    if rgb.shape[2] == 4:
-        fmt = QImage.Format.Format_RGBA8888
+        fmt = QImage.Format.Format_ARGB32
+        if sys.byteorder != "little":
+            image = image[..., ::-1]
     else:
-        fmt = QImage.Format.Format_RGB888
-    h, w, c = rgb.shape
-    qimg = QImage(rgb.data, w, h, w * c, fmt)
+        fmt = QImage.Format.Format_BGR888
+    image = np.ascontiguousarray(image)
+    h, w = image.shape[:2]
+    qimg = QImage(image.data, w, h, image.strides[0], fmt)
     return qimg.copy()
 
 
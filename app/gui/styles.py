@@ -1,4 +1,6 @@
 """Global visual system for SEAMS."""
+import re
+from functools import lru_cache
 
 DARK_THEME = """
 QMainWindow, QWidget {
@@ -608,6 +610,17 @@ QToolTip {
 }
 """
 
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_SPACE_RE = re.compile(r"\s*([{};,])\s*")
 
+
+def _minify(css):
+    """Drop comments and insignificant whitespace before Qt parses the sheet."""
+    css = _SPACE_RE.sub(" ", _COMMENT_RE.sub("", css))
+    return _PUNCT_SPACE_RE.sub(r"\1", css).strip()
+
+
+@lru_cache(maxsize=None)
 def get_dark_theme():
-    return DARK_THEME
+    return _minify(DARK_THEME)
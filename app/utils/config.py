@@ -3,6 +3,13 @@ Application configuration and settings.
 """
 import os
 import json
+from types import MappingProxyType
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .app_logging import get_logger, log_exception, user_data_dir
 
@@ -15,8 +22,8 @@ APP_NAME = "seams"
 APP_VERSION = "3.0.0"
 APP_AUTHOR = "Shubham Panchasara"
 
-# Default settings
-DEFAULT_SETTINGS = {
+# Default settings (read-only; load_settings returns a fresh mutable dict)
+DEFAULT_SETTINGS = MappingProxyType({
     'blend_strength': 0.5,
     'seam_smoothness': 0.5,
     'detail_preservation': 0.75,
@@ -30,7 +37,25 @@ DEFAULT_SETTINGS = {
     'preview_tab': 0,
     'window_width': 1200,
     'window_height': 800,
-}
+})
+
+
+# Bytes last read from or written to the settings file, to skip no-op saves.
+_last_saved = None
+
+
+def _dumps(settings):
+    """Serialize settings to indented UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON bytes read from the settings file."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def get_config_path():
@@ -40,31 +65,43 @@ def get_config_path():
 
 def load_settings():
     """Load settings from config file."""
+    global _last_saved
     config_path = get_config_path()
     
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                saved = json.load(f)
-                # Merge with defaults
-                settings = DEFAULT_SETTINGS.copy()
-                settings.update(saved)
-                return settings
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            saved = _loads(data)
+            _last_saved = data
+            # Merge with defaults
+            return {**DEFAULT_SETTINGS, **saved}
         except Exception as exc:
             log_exception(logger, f"Failed to load settings from {config_path}", exc)
     
-    return DEFAULT_SETTINGS.copy()
+    return dict(DEFAULT_SETTINGS)
 
 
 def save_settings(settings):
-    """Save settings to config file."""
+    """Save settings to config file.
+
+    The file is replaced atomically from a synced temp file, and left alone
+    when its contents would not change.
+    """
+    global _last_saved
     config_path = get_config_path()
     
     try:
+        data = _dumps(settings)
+        if data == _last_saved and os.path.exists(config_path):
+            return True
         tmp_path = f"{config_path}.tmp"
-        with open(tmp_path, 'w') as f:
-            json.dump(settings, f, indent=2)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp_path, config_path)
+        _last_saved = data
         return True
     except Exception as exc:
         log_exception(logger, f"Failed to save settings to {config_path}", exc)
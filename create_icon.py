@@ -6,19 +6,28 @@ import os
 
 def create_ico(png_path, ico_path):
     """Convert PNG to ICO with multiple sizes."""
-    img = Image.open(png_path)
+    img = Image.open(png_path).convert('RGBA')
+    
+    # Centre the source on a transparent square once, so the square frames
+    # below keep its aspect ratio instead of stretching it.
+    side = max(img.size)
+    square = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    square.paste(img, ((side - img.width) // 2, (side - img.height) // 2))
     
     # Create multiple sizes for ICO
     sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
     
-    # Resize and save
+    # Resize as a pyramid: the largest size comes from the source, each
+    # smaller one from the previous level, so the source is resampled once.
     icons = []
-    for size in sizes:
-        resized = img.resize(size, Image.Resampling.LANCZOS)
-        icons.append(resized)
+    level = square
+    for size in sorted(sizes, reverse=True):
+        level = level.resize(size, Image.Resampling.LANCZOS)
+        icons.append(level)
     
-    # Save as ICO
-    img.save(ico_path, format='ICO', sizes=[(s.width, s.height) for s in icons])
+    # Save as ICO; the pre-sized frames are used as-is instead of being
+    # resampled from the source again by the ICO writer.
+    icons[0].save(ico_path, format='ICO', sizes=[(s.width, s.height) for s in icons], append_images=icons[1:])
     print(f"Created: {ico_path}")
 
 if __name__ == '__main__':
@@ -1,6 +1,8 @@
 """SEAMS application entry point."""
+import importlib
 import sys
 import os
+import threading
 
 app_dir = os.path.dirname(os.path.abspath(__file__))
 if app_dir not in sys.path:
@@ -11,7 +13,6 @@ os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.environ.get("APPDATA",
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QSurfaceFormat
 
-from app.gui.main_window import MainWindow
 from app.gui.splash_screen import SplashScreen
 from app.utils.config import APP_NAME
 from app.utils.app_logging import LoggingApplication, install_exception_hook, setup_logging
@@ -28,6 +29,19 @@ def get_icon_path():
     return None
 
 
+# Heavy modules behind MainWindow, imported on a worker thread while the splash plays.
+_PREWARM_MODULES = ("numpy", "cv2", "numba", "PIL.Image", "app.core.seamless", "app.core.normal_generator")
+
+
+def _prewarm_imports():
+    for name in _PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The real import in the main thread reports the failure.
+            pass
+
+
 _app_mutex = None
 
 def main():
@@ -41,6 +55,8 @@ def main():
         except Exception:
             pass
 
+    threading.Thread(target=_prewarm_imports, name="prewarm-imports", daemon=True).start()
+
     logger = setup_logging()
     install_exception_hook()
     logger.info("Starting %s", APP_NAME)
@@ -72,6 +88,7 @@ def main():
     app.processEvents()
 
     # Pre-create main window in background while splash plays
+    from app.gui.main_window import MainWindow
     window = MainWindow()
     window.setAcceptDrops(True)
 
@@ -48,3 +48,50 @@ class TestImageIO:
         path = str(unicode_dir / "test.png")
         save_image(img_u8, path)
         assert os.path.exists(path)
+
+    def test_png_compress_level(self, tmp_path):
+        img_u8 = np.tile(np.arange(256, dtype=np.uint8), (64, 1))
+        fast, small = str(tmp_path / "fast.png"), str(tmp_path / "small.png")
+        save_image(img_u8, fast)
+        save_image(img_u8, small, png_compress_level=9)
+        assert os.path.getsize(small) <= os.path.getsize(fast)
+        assert np.array_equal(load_image(fast)[0], img_u8)
+
+    def test_custom_dpi_is_embedded(self, tmp_path):
+        from PIL import Image
+        from app.utils.image_io import ImageMetadata
+
+        meta = ImageMetadata()
+        meta.dpi = (300, 300)
+        path = str(tmp_path / "dpi.png")
+        save_image(np.zeros((8, 8, 3), dtype=np.uint8), path, metadata=meta)
+        with Image.open(path) as img:
+            assert round(img.info["dpi"][0]) == 300
+
+    def test_save_after_directory_removed(self, tmp_path):
+        import shutil
+
+        out_dir = tmp_path / "out"
+        img_u8 = np.zeros((8, 8, 3), dtype=np.uint8)
+        save_image(img_u8, str(out_dir / "a.png"))
+        shutil.rmtree(out_dir)
+        save_image(img_u8, str(out_dir / "b.png"))
+        assert (out_dir / "b.png").exists()
+
+    def test_load_memory_mapped(self, tmp_path, monkeypatch):
+        import cv2
+        from app.utils import image_io
+
+        monkeypatch.setattr(image_io, "_MMAP_MIN_BYTES", 1)
+        img_u8 = np.random.randint(0, 255, (16, 24, 3), dtype=np.uint8)
+        path = str(tmp_path / "mapped.png")
+        cv2.imwrite(path, img_u8)
+        loaded, meta = load_image(path)
+        assert np.array_equal(loaded, img_u8)
+        assert (meta.width, meta.height, meta.format) == (24, 16, "PNG")
+
+    def test_load_missing_or_folder(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_image(str(tmp_path / "missing.png"))
+        with pytest.raises(IOError, match="not a file"):
+            load_image(str(tmp_path))
@@ -0,0 +1,164 @@
+"""Tests for numpy -> Qt image conversion in the viewer."""
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from app.gui.image_viewer import numpy_to_pixmap, numpy_to_qimage
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _bgr_pixel():
+    img = np.zeros((4, 5, 3), dtype=np.uint8)
+    img[...] = (10, 20, 200)  # B, G, R
+    return img
+
+
+class TestNumpyToQImage:
+    def test_bgr_byte_order(self, qapp):
+        img = _bgr_pixel()
+        qimg = numpy_to_qimage(img)
+        assert qimg.pixel(2, 1) == 0xFFC8140A  # R=200, G=20, B=10
+
+    def test_wraps_array_without_copying(self, qapp):
+        img = _bgr_pixel()
+        qimg = numpy_to_qimage(img)
+        assert int(qimg.constBits()) == img.ctypes.data
+
+    def test_bgra_byte_order(self, qapp):
+        img = np.zeros((4, 5, 4), dtype=np.uint8)
+        img[...] = (10, 20, 200, 255)  # B, G, R, A
+        qimg = numpy_to_pixmap(img).toImage()
+        assert qimg.pixel(2, 1) == 0xFFC8140A
+
+    def test_grayscale(self, qapp):
+        img = np.full((4, 5), 77, dtype=np.uint8)
+        qimg = numpy_to_pixmap(img).toImage()
+        assert qimg.pixel(0, 0) == 0xFF4D4D4D
+
+    @pytest.mark.parametrize("channels", [1, 3, 4])
+    def test_pixmap_outlives_source(self, qapp, channels):
+        shape = (4, 5) if channels == 1 else (4, 5, channels)
+        img = np.full(shape, 200, dtype=np.uint8)
+        if channels == 4:
+            img[..., 3] = 255
+        pixmap = numpy_to_pixmap(img)
+        img[...] = 0
+        del img
+        assert pixmap.toImage().pixel(0, 0) == 0xFFC8C8C8
+
+    def test_pixmap_uses_native_format(self, qapp):
+        pixmap = numpy_to_pixmap(_bgr_pixel())
+        assert pixmap.toImage().format() == QImage.Format.Format_RGB32
+
+    def test_non_contiguous_input(self, qapp):
+        img = np.zeros((4, 10, 3), dtype=np.uint8)
+        img[...] = (10, 20, 200)
+        pixmap = numpy_to_pixmap(img[:, ::2])
+        assert pixmap.width() == 5
+        assert pixmap.toImage().pixel(4, 3) == 0xFFC8140A
+
+
+class TestComposeTiledImage:
+    def test_matches_repeated_tile(self, qapp):
+        pytest.importorskip("numba")
+        from app.gui.image_viewer import compose_tiled_image
+
+        img = np.random.default_rng(0).integers(0, 255, (3, 5, 3), dtype=np.uint8)
+        tile = numpy_to_pixmap(img)
+        composed = compose_tiled_image(tile, 12, 7)
+        assert (composed.width(), composed.height()) == (12, 7)
+        source = tile.toImage()
+        for x, y in [(0, 0), (4, 2), (5, 0), (11, 6), (7, 3)]:
+            assert composed.pixel(x, y) == source.pixel(x % 5, y % 3)
+
+
+class TestPixmapCache:
+    def test_same_array_reuses_pixmap(self, qapp):
+        img = _bgr_pixel()
+        assert numpy_to_pixmap(img) is numpy_to_pixmap(img)
+
+    def test_new_array_converts_again(self, qapp):
+        img = _bgr_pixel()
+        first = numpy_to_pixmap(img)
+        other = img.copy()
+        other[...] = 0
+        assert numpy_to_pixmap(other) is not first
+        assert numpy_to_pixmap(other).toImage().pixel(0, 0) == 0xFF000000
+
+
+class TestTextureViewportLod:
+    def test_picks_coarsest_level_covering_display(self, qapp):
+        from app.gui.image_viewer import TextureViewport
+
+        viewport = TextureViewport()
+        pixmap = numpy_to_pixmap(np.zeros((1024, 1024, 3), dtype=np.uint8))
+        assert viewport._lod_pixmap("after", pixmap, 1024) is pixmap
+        assert viewport._lod_pixmap("after", pixmap, 300).width() == 512
+        assert viewport._lod_pixmap("after", pixmap, 1).width() == 64
+
+
+class TestScaledPixmapCache:
+    def test_reuses_scaled_pixmap_per_size(self, qapp):
+        from app.gui.image_viewer import _scaled_pixmap
+
+        pixmap = numpy_to_pixmap(np.zeros((64, 64, 3), dtype=np.uint8))
+        scaled = _scaled_pixmap(pixmap, 20, 10)
+        assert (scaled.width(), scaled.height()) == (20, 10)
+        assert _scaled_pixmap(pixmap, 20, 10) is scaled
+        assert _scaled_pixmap(pixmap, 21, 10) is not scaled
+
+
+class TestTextureViewportFrameCache:
+    def test_unchanged_state_reuses_last_frame(self, qapp, monkeypatch):
+        from app.gui.image_viewer import TextureViewport
+
+        viewport = TextureViewport()
+        viewport.resize(64, 48)
+        viewport.set_after_image(_bgr_pixel())
+        viewport.grab()
+        calls = []
+        render = viewport._render
+        monkeypatch.setattr(viewport, "_render", lambda painter: calls.append(render(painter)))
+        viewport.grab()
+        assert calls == []
+        viewport.set_show_guides(False)
+        viewport._update_timer.stop()
+        viewport.grab()
+        assert len(calls) == 1
+
+
+class TestAfterImageHandoff:
+    def test_uses_preconverted_qimage(self, qapp):
+        from app.gui.image_viewer import ImageViewer, numpy_to_native_qimage
+
+        viewer = ImageViewer()
+        img = _bgr_pixel()
+        qimg = numpy_to_native_qimage(img)
+        viewer.set_after_image(img, qimg)
+        pixmap = viewer.maps["Base Color"]
+        assert pixmap.cacheKey() != numpy_to_pixmap(img).cacheKey()
+        assert pixmap.toImage().pixel(2, 1) == 0xFFC8140A
+        viewer.cleanup()
+
+    def test_large_frame_reuses_cached_pixmap(self, qapp):
+        from app.gui.image_viewer import _ASYNC_CONVERT_MIN_PIXELS, ImageViewer
+
+        viewer = ImageViewer()
+        side = int(_ASYNC_CONVERT_MIN_PIXELS ** 0.5)
+        img = np.zeros((side, side, 3), dtype=np.uint8)
+        viewer.set_before_image(img)
+        viewer.set_after_image(img)
+        assert viewer.maps["Base Color"].cacheKey() == numpy_to_pixmap(img).cacheKey()
+        viewer.cleanup()
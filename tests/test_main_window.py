@@ -0,0 +1,27 @@
+"""Tests for the main window's worker threads."""
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtWidgets import QApplication
+
+from app.gui.main_window import PreviewThread
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+class TestPreviewThreadProcessor:
+    def test_small_image_reuses_processor(self, qapp):
+        thread = PreviewThread()
+        image = np.zeros((300, 400, 3), dtype=np.float32)
+        first = thread._processor(image, 0.125)
+        assert thread._processor(image, 0.125) is first
+        assert list(thread._processors) == [0.125]
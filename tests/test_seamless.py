@@ -0,0 +1,36 @@
+"""Tests for the seamless processing pipeline."""
+import numpy as np
+import pytest
+
+from app.core.exceptions import PreviewCanceled
+from app.core.seamless import SeamlessProcessor
+
+
+def _make_source(size: int = 64) -> np.ndarray:
+    return np.random.uniform(0, 255, (size, size, 3)).astype(np.float32)
+
+
+class TestPreviewCancel:
+    def test_superseded_preview_raises(self):
+        processor = SeamlessProcessor()
+        processor.load_image(_make_source())
+        with pytest.raises(PreviewCanceled):
+            processor.process(preview=True, use_cache=False, is_canceled=lambda: True)
+
+    def test_current_preview_completes(self):
+        processor = SeamlessProcessor()
+        processor.load_image(_make_source())
+        result = processor.process(preview=True, use_cache=False, is_canceled=lambda: False)
+        assert result.shape == (64, 64, 3)
+
+    def test_chunked_checks_between_tiles(self):
+        processor = SeamlessProcessor()
+        image = np.random.uniform(0, 255, (64, 2112, 3)).astype(np.float32)
+        checks = []
+
+        def is_canceled():
+            checks.append(None)
+            return len(checks) > 3
+
+        with pytest.raises(PreviewCanceled):
+            processor.run_pipeline_chunked(image, is_canceled=is_canceled)
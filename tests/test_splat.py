@@ -2,6 +2,7 @@
 import numpy as np
 import pytest
 
+from app.core.exceptions import PreviewCanceled
 from app.core.materialize_methods import synthesis_splat
 
 
@@ -33,3 +34,8 @@ class TestSplat:
         # Different wobble should produce different result
         r2, _ = synthesis_splat(img, new_size=(64, 64), scale=1.0, wobble=0.8, falloff=0.2)
         assert not np.array_equal(r1, r2)
+
+    def test_splat_cancel_between_variations(self):
+        img = _make_source(128)
+        with pytest.raises(PreviewCanceled):
+            synthesis_splat(img, new_size=(64, 64), rand_rot=0.5, is_canceled=lambda: True)